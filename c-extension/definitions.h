@@ -20,6 +20,28 @@
 
 #endif
 
+/*********************************************************
+*  Runtime dispatch to the widest available vector unit  *
+*********************************************************/
+/* Compile functions additionally for AVX2 and let the loader pick the version
+   supported by the CPU at runtime. SSE2 is the default on x86_64 and NEON on
+   aarch64 so these need no extra version. */
+#define VECTORIZED_CLONES
+#if defined(__GNUC__) && defined(__x86_64__) && defined(__linux__) \
+    && defined(__has_attribute)
+#if __has_attribute(target_clones)
+#undef VECTORIZED_CLONES
+#define VECTORIZED_CLONES __attribute__((target_clones("avx2", "default")))
+#endif
+#endif
+
+/*************************************
+*  Work split for parallel threads  *
+*************************************/
+/* Number of bytes processed by one thread at a time. Must be a multiple of 4 so
+   every chunk starts at the beginning of a pixel. */
+#define CHUNK_SIZE (1 << 20)
+
 /*************
 *  Typedefs  *
 *************/
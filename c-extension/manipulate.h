@@ -12,5 +12,10 @@
 static inline U_CHAR clamp(float value);
 static inline float enhance_brightness(float value, float factor);
 static inline float enhance_contrast(float value, float factor);
-static void enhance_bc_c(U_CHAR* data, const int size, U_SHORT has_alpha,
-                         float brightness, float contrast, char* updated_data);
+static void enhance_chunk_rgb(const U_CHAR* data, const int start, const int end,
+                              float scale, float byte_offset, U_CHAR* updated);
+static void enhance_chunk_argb(const U_CHAR* data, const int start, const int end,
+                               float scale, float byte_offset, U_CHAR* updated);
+static int enhance_bc_c(U_CHAR* data, const int size, U_SHORT has_alpha,
+                        float brightness, float contrast, char* updated_data,
+                        const volatile char* cancel);
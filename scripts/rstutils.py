@@ -11,22 +11,32 @@
 """Utility functions to create reST files."""
 
 
+def subsubsection(title):
+    """Return subsub-section title as string."""
+    return title + "\n" + "=" * len(title) + "\n\n"
+
+
 class RSTFile:
-    """Context manager wrapping a file and adding rst utility methods."""
+    """Context manager wrapping a file and adding rst utility methods.
+
+    All text is collected in a buffer and written to the file at once on exit.
+    """
 
     def __init__(self, filename):
-        self._file = open(filename, "w")
+        self._filename = filename
+        self._buffer = []
         self._write_header()
 
     def __enter__(self):
         return self
 
     def __exit__(self, _type, _value, _traceback):
-        self._file.close()
+        with open(self._filename, "w") as f:
+            f.write("".join(self._buffer))
 
     def write(self, text):
-        """Write text directly to the file."""
-        self._file.write(text)
+        """Write text to the file buffer."""
+        self._buffer.append(text)
 
     def write_section(self, title):
         """Write top-level section title to file."""
@@ -41,8 +51,7 @@ class RSTFile:
 
     def write_subsubsection(self, title):
         """Write subsub-section title to file."""
-        self.write(title + "\n")
-        self.write("=" * len(title) + "\n\n")
+        self.write(subsubsection(title))
 
     def write_table(self, rows, title="", widths="auto"):
         """Write reST table to file.
@@ -11,98 +11,138 @@
 
 """Generate reST documentation from source code docstrings."""
 
+import functools
 import inspect
 import importlib
 import os
+import re
 import sys
+from operator import itemgetter
 
-from vimiv import startup, api
+from rstutils import RSTFile, subsubsection
 
-from rstutils import RSTFile
+
+_PLUGIN_RE = re.compile(r"(?!_)(.+)\.py")  # Python files that are not private
+
+
+def _load_api():
+    """Import vimiv lazily and return the api with all components registered.
+
+    Importing startup loads every module that registers commands, settings and
+    status modules.
+    """
+    from vimiv import startup, api  # pylint: disable=unused-import
+
+    return api
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_getdoc(obj):
+    """Return the docstring of obj, cached as many objects are queried repeatedly."""
+    return inspect.getdoc(obj)
+
+
+def _cached_import(name):
+    """Return module name from sys.modules, importing it only if required."""
+    modules = sys.modules
+    module = modules.get(name)
+    return module if module is not None else importlib.import_module(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _summary(obj):
+    """Return the first line of the docstring of obj."""
+    docstring = _cached_getdoc(obj)
+    return docstring.partition("\n")[0] if docstring else ""
 
 
 def generate_status_modules():
     """Generate table overview of status modules."""
+    api = _load_api()
     print("generating statusbar modules...")
     filename = "docs/documentation/configuration/status_modules.rstsrc"
     with RSTFile(filename) as f:
         rows = [("Module", "Description")]
-        for name in sorted(api.status._modules.keys()):
-            func = api.status._modules[name]._func
+        for name, module in sorted(api.status._modules.items()):
             name = name.strip("{}")
-            desc = inspect.getdoc(func).split("\n")[0]
+            desc = _summary(module._func)
             rows.append((name, desc))
         f.write_table(rows, title="Overview of status modules", widths="30 70")
 
 
-def _write_command_description(cmds, mode, f):
-    """Write description of docstring of commands to documentation file."""
-    for name in sorted(cmds.keys()):
-        cmd = cmds[name]
-        f.write("\n.. _ref_%s_%s:\n\n" % (mode, name))
-        f.write_subsubsection(name)
-        doc = inspect.getdoc(cmd.func)
-        f.write("%s\n\n" % (doc))
-
-
 def generate_commands():
     """Generate table overview and description of the commands."""
+    api = _load_api()
     print("generating commands...")
     with RSTFile("docs/documentation/commands_desc.rstsrc") as f:
         for mode, cmds in api.commands._registry.items():
-            f.write_subsection(mode.name.capitalize())
-            # Table of command overview
+            mname = mode.name
+            f.write_subsection(mname.capitalize())
+            # Table of command overview and description of the docstrings in one pass
             rows = [("Command", "Description")]
-            title = "Overview of %s commands" % (mode.name)
-            for name in sorted(cmds.keys()):
-                cmd = cmds[name]
-                link = ":ref:`ref_%s_%s`" % (mode.name, name)
-                rows.append((link, cmd.description))
+            descriptions = []
+            for name, cmd in sorted(cmds.items()):
+                rows.append((f":ref:`ref_{mname}_{name}`", cmd.description))
+                descriptions.append(
+                    f"\n.. _ref_{mname}_{name}:\n\n"
+                    + subsubsection(name)
+                    + f"{_cached_getdoc(cmd.func)}\n\n"
+                )
+            title = f"Overview of {mname} commands"
             f.write_table(rows, title=title, widths="25 75")
-            _write_command_description(cmds, mode.name, f)
+            f.write("".join(descriptions))
 
 
 def generate_settings():
     """Generate table overview of all settings."""
+    api = _load_api()
     print("generating settings...")
     filename = "docs/documentation/configuration/settings_table.rstsrc"
     with RSTFile(filename) as f:
-        rows = [("Setting", "Description")]
-        for name in sorted(api.settings._storage.keys()):
-            setting = api.settings._storage[name]
-            if setting.desc:  # Otherwise the setting is meant to be hidden
-                rows.append((name, setting.desc))
+        # Settings without description are meant to be hidden
+        rows = [
+            ("Setting", "Description"),
+            *(
+                (name, setting.desc)
+                for name, setting in sorted(api.settings._storage.items())
+                if setting.desc
+            ),
+        ]
         f.write_table(rows, title="Overview of settings", widths="30 70")
 
 
 def generate_keybindings():
     """Generate table overview of default keybindings."""
+    api = _load_api()
     print("generating keybindings...")
     filename = "docs/documentation/configuration/keybindings_table.rstsrc"
     with RSTFile(filename) as f:
         for mode, bindings in api.keybindings.items():
             rows = _gen_keybinding_rows(bindings)
-            title = "Keybindings for %s mode" % (mode.name)
+            title = f"Keybindings for {mode.name} mode"
             f.write_table(rows, title=title, widths="20 80")
 
 
 def _gen_keybinding_rows(bindings):
     """Generate rows for keybindings table."""
-    rows = [("Keybinding", "Command")]
-    for binding, command in bindings.items():
-        rows.append(("\\%s" % (binding), command))
-    return sorted(rows, key=lambda row: row[1])
+    body = sorted(
+        ((f"\\{binding}", command) for binding, command in bindings.items()),
+        key=itemgetter(1),
+    )
+    return [("Keybinding", "Command"), *body]
 
 
 def generate_commandline_options():
     """Generate file including the command line options."""
+    from vimiv import startup
+
     parser = startup.get_argparser()
     optionals, positionals, titles = _get_options(parser)
     # Synopsis
     filename_synopsis = "docs/manpage/synopsis.rstsrc"
     with open(filename_synopsis, "w") as f:
-        synopsis_options = ["[%s]" % (title) for title in titles]
-        synopsis = "**vimiv** %s" % (" ".join(synopsis_options))
+        synopsis_options = [f"[{title}]" for title in titles]
+        synopsis = "**vimiv** " + " ".join(synopsis_options)
         f.write(synopsis)
     # Options
     filename_options = "docs/manpage/options.rstsrc"
@@ -121,15 +161,15 @@ def _get_options(parser):
         positionals: Formatted string of positional arguments.
         titles: List containing all argument titles.
     """
-    optionals = ""
-    positionals = ""
+    optionals = []
+    positionals = []
     titles = []
     for action in parser._optionals._actions:
         if not action.option_strings:
-            positionals += _format_positional(action, titles)
+            positionals.append(_format_positional(action, titles))
         else:
-            optionals += _format_optional(action, titles)
-    return optionals, positionals, titles
+            optionals.append(_format_optional(action, titles))
+    return "".join(optionals), "".join(positionals), titles
 
 
 def _format_optional(action, titles):
@@ -157,7 +197,7 @@ def _format_positional(action, titles):
     Returns:
         Formatted string of this argument.
     """
-    title = "**%s**" % (action.metavar)
+    title = f"**{action.metavar}**"
     titles.append(title)
     desc = action.help
     return _format_option(title, desc)
@@ -170,7 +210,7 @@ def _format_option(title, desc):
         title: The title of this option.
         desc: The help description of this option.
     """
-    return "%s\n\n    %s\n\n" % (title, desc)
+    return f"{title}\n\n    {desc}\n\n"
 
 
 def _format_optional_title(action):
@@ -186,12 +226,12 @@ def _format_optional_title(action):
     formats = []
     for option in action.option_strings:
         if isinstance(action.metavar, str):  # One argument
-            title = "**%s** *%s*" % (option, action.metavar)
+            title = f"**{option}** *{action.metavar}*"
         elif isinstance(action.metavar, tuple):  # Multiple arguments
-            elems = ["*%s*" % (elem) for elem in action.metavar]
-            title = "**%s** %s" % (option, " ".join(elems))
+            elems = [f"*{elem}*" for elem in action.metavar]
+            title = f"**{option}** " + " ".join(elems)
         else:  # No arguments
-            title = "**%s**" % (option)
+            title = f"**{option}**"
         formats.append(title)
     return formats
 
@@ -204,22 +244,21 @@ def generate_plugins():
     plugins_directory = "vimiv/plugins"
     sys.path.insert(0, plugins_directory)
 
-    plugin_names = sorted(
-        [
-            filename.replace(".py", "")
-            for filename in os.listdir(plugins_directory)
-            if not filename.startswith("_") and filename.endswith(".py")
-        ]
-    )
-
-    def get_plugin_description(name):
-        module = importlib.import_module(name, plugins_directory)
-        docstring = inspect.getdoc(module)
-        return docstring.split("\n")[0].strip(" .")
+    with os.scandir(plugins_directory) as entries:
+        matches = (
+            _PLUGIN_RE.fullmatch(entry.name)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+        )
+        plugins = {
+            match.group(1): _cached_import(match.group(1)) for match in matches if match
+        }
 
     rows = [("Name", "Description")]
-    for name in plugin_names:
-        rows.append((name, get_plugin_description(name)))
+    rows.extend(
+        (name, _summary(module).strip(" ."))
+        for name, module in sorted(plugins.items())
+    )
 
     with RSTFile(filename) as f:
         f.write_table(rows, title="Overview of default plugins", widths="20 80")
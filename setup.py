@@ -7,13 +7,65 @@
 import ast
 import os
 import re
+import tempfile
+from distutils import log
+from distutils.errors import CompileError, LinkError
+
 import setuptools
+from setuptools.command.build_ext import build_ext
 
 # C extensions
 manipulate_module = setuptools.Extension(
     "vimiv.imutils._c_manipulate", sources=["c-extension/manipulate.c"]
 )
 
+OPENMP_FLAG = "-fopenmp"
+OPENMP_TEST = """
+#include <omp.h>
+int main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }
+"""
+
+
+def has_openmp(compiler):
+    """Return True if the compiler can build and link a program using OpenMP.
+
+    Only unix-style compilers accepting -fopenmp, e.g. gcc and clang, are probed.
+    Other compilers such as MSVC, which would need /openmp, always build the serial
+    version.
+    """
+    if compiler.compiler_type != "unix":
+        return False
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = os.path.join(tmpdir, "openmp_test.c")
+        with open(source, "w") as f:
+            f.write(OPENMP_TEST)
+        try:
+            objects = compiler.compile(
+                [source], output_dir=tmpdir, extra_postargs=[OPENMP_FLAG]
+            )
+            compiler.link_executable(
+                objects, "openmp_test", output_dir=tmpdir, extra_postargs=[OPENMP_FLAG]
+            )
+        except (CompileError, LinkError):
+            return False
+    return True
+
+
+class BuildExt(build_ext):
+    """Build C extensions in parallel using OpenMP if the compiler supports it.
+
+    Without OpenMP the pragmas are ignored and the kernel runs serially.
+    """
+
+    def build_extensions(self):
+        if has_openmp(self.compiler):
+            for extension in self.extensions:
+                extension.extra_compile_args.append(OPENMP_FLAG)
+                extension.extra_link_args.append(OPENMP_FLAG)
+        else:
+            log.warn("OpenMP not supported by the compiler, building serial version")
+        super().build_extensions()
+
 
 try:
     BASEDIR = os.path.dirname(os.path.realpath(__file__))
@@ -39,6 +91,7 @@ setuptools.setup(
     python_requires=">=3.6",
     packages=setuptools.find_packages(),
     ext_modules=[manipulate_module],
+    cmdclass={"build_ext": BuildExt},
     entry_points={"gui_scripts": ["vimiv = vimiv.startup:main"]},
     name="vimiv",
     version=".".join(str(num) for num in read_from_init("version_info")),
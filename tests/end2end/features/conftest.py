@@ -7,12 +7,14 @@
 """bdd-like steps for end2end testing."""
 
 import os
+import time
 
 from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtWidgets import QApplication
 
 import pytest_bdd as bdd
 
+import vimivprocess
 from vimiv import api
 from vimiv.commands import runners
 from vimiv.gui import commandline, statusbar, mainwindow, library, thumbnail
@@ -25,14 +27,16 @@ from vimiv.imutils import filelist
 
 
 @bdd.when(bdd.parsers.parse("I run {command}"))
-def run_command(command):
+def run_command(command, qtbot):
     runners.run(command, mode=api.modes.current())
+    vimivprocess.wait_for_images(qtbot)
 
 
 @bdd.when(bdd.parsers.parse("I press {keys}"))
 def key_press(qtbot, keys):
     mode = api.modes.current()
     qtbot.keyClicks(mode.widget, keys)
+    vimivprocess.wait_for_images(qtbot)
 
 
 @bdd.when("I activate the command line")
@@ -61,9 +65,8 @@ def enter_command_with_text(text):
 
 @bdd.when(bdd.parsers.parse("I resize the window to {size}"))
 def resize_main_window(size):
-    width = int(size.split("x")[0])
-    height = int(size.split("x")[1])
-    mainwindow.instance().resize(width, height)
+    width, _, height = size.partition("x")
+    mainwindow.instance().resize(int(width), int(height))
 
 
 @bdd.when(bdd.parsers.parse("I wait for {N}ms"))
@@ -74,14 +77,11 @@ def wait(qtbot, N):
 @bdd.when("I wait for the command to complete")
 def wait_for_external_command(qtbot):
     """Wait until the external process has completed."""
-    max_iterations = 100
-    iteration = 0
-    while (
-        QThreadPool.globalInstance().activeThreadCount() and iteration < max_iterations
-    ):
-        qtbot.wait(10)
-        iteration += 1
-    assert iteration != max_iterations, "external command timed out"
+    _wait_until(
+        qtbot,
+        lambda: QThreadPool.globalInstance().activeThreadCount() == 0,
+        "external command timed out",
+    )
 
 
 ###############################################################################
@@ -90,28 +90,27 @@ def wait_for_external_command(qtbot):
 
 
 @bdd.then("no crash should happen")
-def no_crash(qtbot):
+def no_crash():
     """Don't do anything, exceptions fail the test anyway."""
-    qtbot.wait(0.01)
 
 
 @bdd.then(bdd.parsers.parse("the message\n'{message}'\nshould be displayed"))
 def check_statusbar_message(qtbot, message):
     bar = statusbar.statusbar
+    label = bar["message"]
     _check_status(
-        qtbot,
-        lambda: message == bar["message"].text(),
-        info=f"Message expected: '{message}'",
+        qtbot, lambda: message == label.text(), info=f"Message expected: '{message}'"
     )
-    assert bar["stack"].currentWidget() == bar["message"]
+    assert bar["stack"].currentWidget() == label
 
 
 @bdd.then(bdd.parsers.parse("the {position} status should include {text}"))
 def check_left_status(qtbot, position, text):
     bar = statusbar.statusbar
+    label = bar[position]
     _check_status(
         qtbot,
-        lambda: text in bar[position].text(),
+        lambda: text in label.text(),
         info=f"position {position} should include {text}",
     )
     assert bar["stack"].currentWidget() == bar["status"]
@@ -120,18 +119,16 @@ def check_left_status(qtbot, position, text):
 @bdd.then("a message should be displayed")
 def check_a_statusbar_message(qtbot):
     bar = statusbar.statusbar
-    _check_status(
-        qtbot, lambda: bar["message"].text() != "", info="Any message expected"
-    )
-    assert bar["stack"].currentWidget() == bar["message"]
+    label = bar["message"]
+    _check_status(qtbot, lambda: label.text() != "", info="Any message expected")
+    assert bar["stack"].currentWidget() == label
 
 
 @bdd.then("no message should be displayed")
 def check_no_statusbar_message(qtbot):
     bar = statusbar.statusbar
-    _check_status(
-        qtbot, lambda: bar["message"].text() == "", info="No message expected"
-    )
+    label = bar["message"]
+    _check_status(qtbot, lambda: label.text() == "", info="No message expected")
     assert bar["stack"].currentWidget() == bar["status"]
 
 
@@ -180,11 +177,10 @@ def check_selected_thumbnail(qtbot, N):
 
 @bdd.then(bdd.parsers.parse("the pop up '{title}' should be displayed"))
 def check_popup_displayed(title):
-    for window in QApplication.topLevelWindows():
-        if window.title() == title:
-            window.close()
-            return
-    raise AssertionError(f"Window '{title}' not found")
+    windows = {window.title(): window for window in QApplication.topLevelWindows()}
+    window = windows.get(title)
+    assert window is not None, f"Window '{title}' not found"
+    window.close()
 
 
 @bdd.then(bdd.parsers.parse("the filelist should contain {number} images"))
@@ -194,9 +190,12 @@ def check_filelist_length(number):
 
 def _check_status(qtbot, assertion, info=""):
     """Check statusbar repeatedly as this is threaded and may take a while."""
-    iteration = 0
-    max_iterations = 100
-    while not assertion() and iteration < max_iterations:
+    _wait_until(qtbot, assertion, "Statusbar check timed out\n" + info)
+
+
+def _wait_until(qtbot, condition, message, timeout=1.0):
+    """Process Qt events until condition is fulfilled, fail with message on timeout."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, message
         qtbot.wait(10)
-        iteration += 1
-    assert iteration != max_iterations, "Statusbar check timed out\n" + info
@@ -33,3 +33,8 @@ Feature: Navigating through the displayed images
     Scenario: Move to specific image using goto with count
         When I run 3goto 1
         Then the image should have the index 3
+
+    Scenario: Do not keep transformations made while the next image is read
+        When I run next and rotate before the image was read
+        Then the image should have the index 2
+        And the image should not be transformed
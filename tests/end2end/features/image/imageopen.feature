@@ -5,6 +5,12 @@ Feature: Open different images and image formats
         When I open broken images
         Then no crash should happen
 
+    Scenario: Error on image data that cannot be decoded
+        Given I open any image
+        When I open a truncated image
+        Then no crash should happen
+        And the truncated image should be known as broken
+
     # This does the magic to open all images in the directory
     # Therefore only the index, not the total number of images changes
     Scenario: Open single image using the open command
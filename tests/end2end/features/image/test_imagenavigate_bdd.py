@@ -4,7 +4,32 @@
 # Copyright 2017-2019 Christian Karl (karlch) <karlch at protonmail dot com>
 # License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
 
+import pytest
 import pytest_bdd as bdd
 
+import vimivprocess
+from vimiv import api
+from vimiv.commands import runners
+from vimiv.imutils import _file_handler
+
 
 bdd.scenarios("imagenavigate.feature")
+
+
+@pytest.fixture()
+def handler():
+    yield api.objreg.get(_file_handler.ImageFileHandler)
+
+
+@bdd.when("I run next and rotate before the image was read")
+def next_and_rotate(qtbot, handler):
+    runners.run("next", mode=api.modes.IMAGE)
+    assert handler.loading, "Image was not read in an extra thread"
+    runners.run("rotate", mode=api.modes.IMAGE)
+    vimivprocess.wait_for_images(qtbot)
+
+
+@bdd.then("the image should not be transformed")
+def check_not_transformed(handler):
+    assert not handler.transform.changed()
+    assert handler.current is handler.original
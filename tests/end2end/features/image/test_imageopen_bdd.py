@@ -7,8 +7,11 @@
 import imghdr
 
 import pytest_bdd as bdd
+from PyQt5.QtGui import QPixmap
 
-from vimiv import app
+import vimivprocess
+from vimiv import api, app
+from vimiv.imutils import _file_handler
 
 
 bdd.scenarios("imageopen.feature")
@@ -23,6 +26,24 @@ def open_broken_images(tmpdir):
     _open_file(tmpdir, b"BM")  # BMP
 
 
+@bdd.when("I open a truncated image")
+def open_truncated_image(tmpdir, qtbot):
+    path = str(tmpdir.join("truncated.png"))
+    QPixmap(300, 300).save(path, "png")
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:  # Valid header but broken image data
+        f.write(data[: len(data) // 2])
+    app.open([path])
+    vimivprocess.wait_for_images(qtbot)
+
+
+@bdd.then("the truncated image should be known as broken")
+def check_truncated_image_broken(tmpdir):
+    handler = api.objreg.get(_file_handler.ImageFileHandler)
+    assert str(tmpdir.join("truncated.png")) in handler._bad_paths
+
+
 def _open_file(tmpdir, data):
     """Open a file containing the bytes from data."""
     path = str(tmpdir.join("broken"))
@@ -14,5 +14,8 @@ bdd.scenarios("imagetitle.feature")
 
 
 @bdd.then("the image name should be in the window title")
-def image_name_in_title():
-    assert filelist.basename() in mainwindow.instance().windowTitle()
+def image_name_in_title(qtbot):
+    def check_title():  # The title is updated delayed
+        assert filelist.basename() in mainwindow.instance().windowTitle()
+
+    qtbot.waitUntil(check_title, timeout=1000)
@@ -19,6 +19,10 @@ def check_library_size(fraction, qtbot):
     fraction = float(fraction)
     # Check if setting was updated
     assert api.settings.library.width.value == pytest.approx(fraction)
-    # Check if width fits fraction of main window
-    real_fraction = library.instance().width() / mainwindow.instance().width()
-    assert fraction == real_fraction
+
+    # Check if width fits fraction of main window, resizing is processed delayed
+    def check_fraction():
+        real_fraction = library.instance().width() / mainwindow.instance().width()
+        assert fraction == real_fraction
+
+    qtbot.waitUntil(check_fraction, timeout=1000)
@@ -16,7 +16,7 @@ mock.patch("vimiv.utils.cached_method", lambda x: x).start()
 from vimiv import api, startup  # noqa
 from vimiv.commands import runners  # noqa
 from vimiv.utils import working_directory  # noqa
-from vimiv.imutils import filelist, immanipulate  # noqa
+from vimiv.imutils import filelist, immanipulate, _file_handler  # noqa
 
 
 _processes = []
@@ -40,6 +40,18 @@ def exit():
     del _processes[0]
 
 
+def wait_for_images(qtbot, timeout=1000):
+    """Wait until images read in extra threads are displayed.
+
+    Raises:
+        pytestqt.exceptions.TimeoutError if the image was not loaded within timeout.
+    """
+    handler = api.objreg.get(_file_handler.ImageFileHandler)
+    if handler.loading:
+        with qtbot.waitSignal(handler.loaded, timeout=timeout, raising=True):
+            pass
+
+
 class VimivProc:
     """Process class to start and exit one vimiv process."""
 
@@ -52,13 +64,16 @@ class VimivProc:
         working_directory.handler.WAIT_TIME = 0.001
         # No key holding happens, waiting is not necessary
         immanipulate.WAIT_TIME = 0.001
+        wait_for_images(qtbot)
 
     def exit(self):
         # Do not start any new threads
         QThreadPool.globalInstance().clear()
         # Wait for any running threads to exit safely
         QThreadPool.globalInstance().waitForDone(5000)  # Kill after 5s
-        runners._last_command.clear()
+        runners._last_command[:] = [None] * len(runners._last_command)
+        for module in api.status._modules.values():  # Bound to the exited instances
+            module._resolved = None
         filelist._paths = []
         filelist._index = 0
         # Needed for cleanup
@@ -0,0 +1,35 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+# This file is part of vimiv.
+# Copyright 2017-2019 Christian Karl (karlch) <karlch at protonmail dot com>
+# License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
+
+"""Tests for vimiv.api.completion."""
+
+import pytest
+
+from vimiv.api import completion
+
+
+@pytest.fixture
+def modules(monkeypatch):
+    """Fixture to replace the registered completion modules with their names."""
+    names = ["", ":", ":!", ":set ", ":set statusbar.show"]
+    monkeypatch.setattr(completion, "_modules", {name: name for name in names})
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", ""),
+        (":", ":"),
+        (":quit", ":"),
+        (":!ls", ":!"),
+        (":set", ":"),
+        (":set ", ":set "),
+        (":set library.width", ":set "),
+        (":set statusbar.show ", ":set statusbar.show"),
+    ],
+)
+def test_get_module_longest_prefix(modules, text, expected):
+    assert completion.get_module(text) == expected
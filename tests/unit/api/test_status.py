@@ -32,3 +32,26 @@ def test_log_unknown_module(mocker):
     mocker.patch.object(status, "_log_unknown_module")
     assert status.evaluate("Dummy: {unknown}") == "Dummy: "
     assert status._log_unknown_module.call_count == 1
+
+
+def test_evaluate_repeated_module_once():
+    calls = []
+
+    @status.module("{dummy}")
+    def dummy_method():
+        calls.append(None)
+        return "dummy"
+
+    assert status.evaluate("{dummy} and {dummy}") == "dummy and dummy"
+    assert len(calls) == 1
+    del status._modules["{dummy}"]  # Cleanup
+
+
+def test_batch_updates(qtbot):
+    with qtbot.waitSignal(status.signals.update):
+        with status.batch():
+            with qtbot.assertNotEmitted(status.signals.update):
+                status.update()
+                with status.batch():
+                    status.update()
+                status.update()
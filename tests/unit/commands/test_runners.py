@@ -0,0 +1,85 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+# This file is part of vimiv.
+# Copyright 2017-2019 Christian Karl (karlch) <karlch at protonmail dot com>
+# License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
+
+"""Tests for vimiv.commands.runners."""
+
+import pytest
+
+from vimiv import api
+from vimiv.commands import aliases, runners
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("quit", ("", "quit", [])),
+        ("5next", ("5", "next", [])),
+        ("  12zoom in  ", ("12", "zoom", ["in"])),
+        ("open 'with space' other", ("", "open", ["with space", "other"])),
+        ('rename "a b"', ("", "rename", ["a b"])),
+        ("open with\\ escape", ("", "open", ["with escape"])),
+    ],
+)
+def test_parse(text, expected):
+    assert runners._parse(text) == expected
+
+
+def test_parse_unclosed_quotation():
+    with pytest.raises(ValueError):
+        runners._parse("open 'unclosed")
+
+
+@pytest.fixture
+def mock_paths(mocker):
+    mocker.patch.object(runners.pathreceiver, "current", return_value="image 1.jpg")
+    mocker.patch.object(
+        runners.api.mark, "_marked", ["marked_%.jpg", "other_marked.jpg"]
+    )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("!rm image.jpg", "!rm image.jpg"),
+        ("!rm %", "!rm 'image 1.jpg'"),
+        ("!cp % %.bak", "!cp 'image 1.jpg' 'image 1.jpg'.bak"),
+        ("!rm \\%", "!rm \\%"),
+        ("!rm %m", "!rm marked_%.jpg other_marked.jpg"),
+    ],
+)
+def test_expand_percent(mock_paths, text, expected):
+    assert runners.expand_percent(text, None) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("quit", "quit"),
+        ("short", "long command"),
+        ("short arg", "long command arg"),
+        ("open short", "open short"),
+    ],
+)
+def test_alias(text, expected):
+    aliases.alias("short", ["long", "command"])
+    assert runners.alias(text, api.modes.IMAGE) == expected
+    del aliases._aliases[api.modes.GLOBAL]["short"]
+
+
+@pytest.mark.parametrize(
+    "text, shell",
+    [
+        ("touch file", False),
+        ("mkdir -p new_directory", False),
+        ("ls | grep jpg", True),
+        ("rm *.jpg", True),
+        ("touch 'my file'", True),
+        ("echo $HOME", True),
+        ("cd ~", True),
+    ],
+)
+def test_shell_expression(text, shell):
+    assert bool(runners._shell_expression.search(text)) == shell
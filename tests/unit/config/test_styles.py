@@ -42,3 +42,13 @@ def test_fail_get_nonexisting_style_option(mocker, new_style):
     styles._style = new_style
     assert styles.get("anything") == ""
     styles._style = None
+
+
+def test_apply_dereferences_style_options(mocker, new_style):
+    new_style["image.bg"] = "#000000"
+    styles._style = new_style
+    widget = mocker.Mock(STYLESHEET="QLabel { background: {image.bg}; }")
+    styles.apply(widget)
+    widget.setStyleSheet.assert_called_once_with("QLabel { background: #000000; }")
+    styles._style = None
+    styles._dereference.cache_clear()
@@ -0,0 +1,64 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+# This file is part of vimiv.
+# Copyright 2017-2019 Christian Karl (karlch) <karlch at protonmail dot com>
+# License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
+
+"""Tests for vimiv.utils.thumbnail_manager."""
+
+import pytest
+
+from vimiv.utils import thumbnail_manager
+
+
+@pytest.fixture
+def pool(mocker):
+    """Mock of the thread pool which does not start any workers."""
+    pool = mocker.patch.object(thumbnail_manager.ThumbnailManager, "pool")
+    pool.maxThreadCount.return_value = 4
+    yield pool
+
+
+@pytest.fixture
+def manager(qapp, mocker, monkeypatch, tmpdir, pool):
+    """Thumbnail manager with pending paths but without running creators."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    mocker.patch.object(thumbnail_manager.pixmap_creater, "error_thumbnail")
+    manager = thumbnail_manager.ThumbnailManager()
+    manager._pending = {i: "image_%d.jpg" % (i) for i in range(5)}
+    yield manager
+
+
+def test_take_pending_in_order(manager):
+    assert manager.take_pending() == (0, "image_0.jpg")
+    assert manager.take_pending() == (1, "image_1.jpg")
+
+
+def test_take_pending_empty(manager):
+    manager._pending = {}
+    assert manager.take_pending() is None
+
+
+def test_prioritize(manager):
+    manager.prioritize({3: "image_3.jpg", 4: "image_4.jpg"})
+    assert list(manager._pending) == [3, 4, 0, 1, 2]
+
+
+def test_prioritize_recreates_taken(manager):
+    manager.take_pending()
+    manager.prioritize({0: "image_0.jpg", 2: "image_2.jpg"})
+    assert list(manager._pending) == [0, 2, 1, 3, 4]
+
+
+def test_start_workers_only_for_idle_threads(manager, pool):
+    manager._start_workers()
+    manager._start_workers()
+    assert pool.start.call_count == 4
+
+
+def test_start_workers_after_worker_finished(manager, pool):
+    manager._start_workers()
+    manager._pending = {}
+    manager.take_pending()  # Worker finds nothing pending and finishes
+    manager.prioritize({0: "image_0.jpg"})
+    assert pool.start.call_count == 5
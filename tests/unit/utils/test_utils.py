@@ -6,7 +6,6 @@
 
 """Tests for vimiv.utils"""
 
-import inspect
 import pytest
 from PyQt5.QtCore import pyqtSignal, QObject
 
@@ -21,6 +20,10 @@ def test_strip_html():
     assert utils.strip_html("<b>hello</b>") == "hello"
 
 
+def test_strip_html_without_tags():
+    assert utils.strip_html("1 < 2") == "1 < 2"
+
+
 def test_wrap_style_span():
     assert (
         utils.wrap_style_span("color: red", "text")
@@ -72,7 +75,7 @@ def test_slot_ignore_self():
     def test(self, name: str):
         ...
 
-    slot_args = utils._slot_args(inspect.getfullargspec(test), test)
+    slot_args = utils._slot_args(test)
     assert slot_args == [str]
 
 
@@ -80,7 +83,7 @@ def test_slot_add_returntype():
     def test(self, name: str) -> str:
         ...
 
-    slot_kwargs = utils._slot_kwargs(inspect.getfullargspec(test))
+    slot_kwargs = utils._slot_kwargs(test)
     assert slot_kwargs == {"result": str}
 
 
@@ -109,3 +112,11 @@ def test_remove_prefix():
 
 def test_remove_prefix_not_found():
     assert utils.remove_prefix("start hello", "starter") == "start hello"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("12next", ("12", "next")), ("next", ("", "next")), ("42", ("42", ""))],
+)
+def test_split_count(text, expected):
+    assert utils.split_count(text) == expected
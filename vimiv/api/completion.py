@@ -69,12 +69,12 @@ def get_module(text: str) -> "BaseFilter":
     Returns:
         A completion model providing completion options.
     """
-    best_match, best_match_size = cast(BaseFilter, None), -1
-    for required_text, module in _modules.items():
-        match_size = len(required_text)
-        if text.startswith(required_text) and len(required_text) > best_match_size:
-            best_match, best_match_size = module, match_size
-    return best_match
+    # Check prefixes of text starting with the longest, the first one found wins
+    for end in range(len(text), -1, -1):
+        module = _modules.get(text[:end])
+        if module is not None:
+            return module
+    return cast(BaseFilter, None)
 
 
 class BaseFilter(QSortFilterProxyModel):
@@ -145,10 +145,17 @@ class FuzzyFilter(TextFilter):
 class BaseModel(QStandardItemModel):
     """Base model used for completion models.
 
+    Class Attributes:
+        REBUILD_ON_TEXT_CHANGE: If True, on_text_changed is called on every change of
+            the command line text. Otherwise it is only called when the command line
+            text switches to this model.
+
     Attributes:
         column_widths: Tuple of floats [0..1] defining the width of each column.
     """
 
+    REBUILD_ON_TEXT_CHANGE = False
+
     def __init__(
         self,
         text: str,
@@ -182,7 +189,9 @@ class BaseModel(QStandardItemModel):
     def on_text_changed(self, text: str) -> None:
         """Called by the completer when the commandline text has changed.
 
-        This allows models to change their content accordingly.
+        This allows models to change their content accordingly. Unless
+        REBUILD_ON_TEXT_CHANGE is set, this is only called when the text changes to
+        this model.
 
         Args:
             text: The current text in the comand line.
@@ -30,7 +30,7 @@ All modes inherit from the common :class:`Mode` base class.
 
 import abc
 import logging
-from typing import cast, Any, Callable, List
+from typing import cast, Any, Callable, Dict, List, Optional
 
 from PyQt5.QtCore import pyqtSignal, QObject
 from PyQt5.QtWidgets import QWidget
@@ -46,17 +46,16 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
     """Base class for modes.
 
     Class Attributes:
-        _ID: Unique identifier used to compare modes.
+        _ID: Unique identifier used to hash modes.
 
     Attributes:
-        active: True if the mode is currently active.
         last_fallback: Mode to use as _last in case _last was closed.
         widget: QWidget associated with this mode.
 
         _last: Mode that was active before entering this one.
         _name: Name of the mode used for commands which require a string
             representation.
-        _id: The unique identifier used to compare modes.
+        _id: The unique identifier used to hash modes.
 
     Signals:
         entered: Emitted when this mode is entered.
@@ -70,7 +69,6 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
 
     def __init__(self, name: str):
         super().__init__()
-        self.active = False
         self.last_fallback = cast(Mode, None)  # Initialized to a mode in _init()
         self.widget = cast(QWidget, None)  # Initialized to a QWidget using @widget
 
@@ -83,6 +81,7 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
 
     def enter(self) -> None:
         """Enter this mode."""
+        global _current
         last_mode = current()
         # Nothing to do as we all already in this mode
         if last_mode == self:
@@ -91,10 +90,9 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
         # Store last mode
         if last_mode:
             logging.debug("Leaving mode %s", last_mode.name)
-            last_mode.active = False
             self.last = last_mode
         # Set to active and focus widget
-        self.active = True
+        _current = self
         self.widget.show()
         self.widget.setFocus()
         if self.widget.hasFocus():
@@ -122,9 +120,14 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
         else:
             self.enter()
 
+    @property
+    def active(self) -> bool:
+        """True if the mode is currently active."""
+        return self is _current
+
     @property
     def identifier(self) -> int:
-        """Value of _id to compare to other modes as property."""
+        """Unique integer identifier of this mode as read-only property."""
         return self._id
 
     @property
@@ -154,9 +157,8 @@ class Mode(QObject, metaclass=AbstractQObjectMeta):
         pass
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Mode):
-            return self.identifier == other.identifier
-        return False
+        # Modes are singletons, comparing them is equivalent to comparing identity
+        return self is other
 
     def __hash__(self) -> int:
         return self._id
@@ -181,10 +183,10 @@ def get_by_name(name: str) -> Mode:
     Returns:
         The corresponding :class:`vimiv.api.modes.Mode` class.
     """
-    for mode in ALL:
-        if mode.name.lower() == name.lower():
-            return mode
-    raise KeyError("'%s' is not a valid mode" % (name.upper()))
+    try:
+        return _BY_NAME[name.lower()]
+    except KeyError:
+        raise KeyError("'%s' is not a valid mode" % (name.upper())) from None
 
 
 def widget(mode: Mode) -> Callable:
@@ -221,7 +223,7 @@ class _MainMode(Mode):
 
     def _set_last(self, mode: Mode) -> None:
         """Store any mode except for command and manipulate."""
-        if mode not in [COMMAND, MANIPULATE]:
+        if mode is not COMMAND and mode is not MANIPULATE:
             self._last = mode
 
 
@@ -230,7 +232,7 @@ class _CommandMode(Mode):
 
     def _set_last(self, mode: Mode) -> None:
         """Store any mode except for command."""
-        if mode != self:
+        if mode is not self:
             self._last = mode
 
 
@@ -246,21 +248,24 @@ MANIPULATE = _MainMode("manipulate")
 # Utility lists to allow iterating
 ALL: List[Mode] = [GLOBAL, IMAGE, LIBRARY, THUMBNAIL, COMMAND, MANIPULATE]
 GLOBALS: List[Mode] = [IMAGE, LIBRARY, THUMBNAIL]
+_BY_NAME: Dict[str, Mode] = {mode.name: mode for mode in ALL}
+
+_current = cast(Optional[Mode], None)  # The currently active mode, set in _init()
 
 
 def current() -> Mode:
     """Return the currently active mode."""
-    for mode in ALL:
-        if mode.active:
-            return mode
-    raise NoMode()
+    if _current is None:
+        raise NoMode()
+    return _current
 
 
 def _init() -> None:
     """Initialize default values for each mode."""
+    global _current
     for _mode in ALL:
         if _mode == IMAGE:
-            _mode.active = True  # Default mode
+            _current = _mode  # Default mode
             _mode.last = _mode.last_fallback = LIBRARY
         else:
             _mode.last = _mode.last_fallback = IMAGE
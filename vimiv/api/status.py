@@ -32,14 +32,15 @@ If any other object requires the status to be updated, they should call
 :func:`vimiv.api.status.update`.
 """
 
+import contextlib
 import functools
 import logging
 import re
-from typing import Callable
+from typing import Callable, Dict, Iterator, Match, Optional, Set
 
 from PyQt5.QtCore import pyqtSignal, QObject
 
-from vimiv.utils import cached_method, is_method, class_that_defined_method
+from vimiv.utils import is_method, class_that_defined_method
 from . import objreg
 
 
@@ -49,6 +50,9 @@ Module = Callable[..., str]
 
 _modules = {}  # Dictionary storing all status modules
 _module_expression = re.compile(r"\{.*?\}")  # Expression to match all status modules
+_batch_depth = 0  # Number of nested batch contexts currently active
+_update_pending = False  # True if an update was requested during a batch
+_unknown_modules: Set[str] = set()  # Unknown modules that were already logged
 
 
 class InvalidModuleName(Exception):
@@ -56,35 +60,46 @@ class InvalidModuleName(Exception):
 
 
 class _Module:
-    """Class to store function of one status module."""
+    """Class to store function of one status module.
+
+    Attributes:
+        _func: The function or method registered as status module.
+        _is_method: True if _func is a method which requires the class instance.
+        _resolved: Function to call without arguments, created on first call.
+    """
+
+    __slots__ = ("_func", "_is_method", "_resolved")
 
     def __init__(self, func: Module):
         self._func = func
+        # The class does not exist yet during decoration, the signature is known
+        self._is_method = is_method(func)
+        self._resolved: Optional[Module] = None
 
     def __call__(self) -> str:
-        func = self._create_func(self._func)
-        return func()
+        if self._resolved is None:
+            self._resolved = self._create_func()
+        return self._resolved()
 
     def __repr__(self) -> str:
         return "StatusModule('%s')" % (self._func.__name__)
 
-    @cached_method
-    def _create_func(self, func: Module) -> Module:
+    def _create_func(self) -> Module:
         """Create function to call for a status module.
 
         This retrieves the instance of a class object for methods and sets it
-        as first argument (the 'self' argument) of a lambda. For standard
+        as first argument (the 'self' argument) of a partial. For standard
         functions nothing is done.
 
         Returns:
             A function to be called without arguments.
         """
-        logging.debug("Creating function for status module '%s'", func.__name__)
-        if is_method(func):
-            cls = class_that_defined_method(func)
+        logging.debug("Creating function for status module '%s'", self._func.__name__)
+        if self._is_method:
+            cls = class_that_defined_method(self._func)
             instance = objreg.get(cls)
-            return functools.partial(func, instance)
-        return func
+            return functools.partial(self._func, instance)
+        return self._func
 
 
 def module(name: str) -> Callable[[Module], Module]:
@@ -130,26 +145,34 @@ def evaluate(text: str) -> str:
     Returns:
         The updated text.
     """
-    modules = _module_expression.findall(text)
-    for module_name in modules:
-        try:
-            text = text.replace(module_name, _modules[module_name]())
-        except KeyError:
-            text = text.replace(module_name, "")
-            _log_unknown_module(module_name)
-    return text
+    evaluated: Dict[str, str] = {}  # Evaluate modules occuring multiple times once
+    get_module = _modules.get
+
+    def evaluate_module(match: Match) -> str:
+        module_name = match.group()
+        if module_name not in evaluated:
+            func = get_module(module_name)
+            if func is None:
+                _log_unknown_module(module_name)
+                evaluated[module_name] = ""
+            else:
+                evaluated[module_name] = func()
+        return evaluated[module_name]
+
+    return _module_expression.sub(evaluate_module, text)
 
 
-@functools.lru_cache(None)
 def _log_unknown_module(module_name: str) -> None:
     """Display log warning for unknown module.
 
-    The lru_cache is used so each module is only logged once, not on every evaluation of
-    the status text.
+    Each module is only logged once, not on every evaluation of the status text.
 
     Args:
         module_name: Module string that is unknown.
     """
+    if module_name in _unknown_modules:
+        return
+    _unknown_modules.add(module_name)
     logging.warning("Disabling unknown statusbar module '%s'", module_name)
 
 
@@ -172,9 +195,36 @@ def update() -> None:
     """Emit signal to update the current status.
 
     This function can be called when an update of the status is required. It
-    is, for example, always called after a command was run.
+    is, for example, always called after a command was run. Within a
+    :func:`batch` the signal is delayed until the batch is finished.
+    """
+    global _update_pending
+    if _batch_depth:
+        _update_pending = True
+    else:
+        signals.update.emit()
+
+
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+    """Context manager to combine all status updates into a single one.
+
+    Any call to :func:`update` within the context is delayed until the outermost
+    batch exits. The update signal is then emitted at most once::
+
+        with status.batch():
+            first_function_that_updates_status()
+            second_function_that_updates_status()
     """
-    signals.update.emit()
+    global _batch_depth, _update_pending
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth and _update_pending:
+            _update_pending = False
+            signals.update.emit()
 
 
 def clear() -> None:
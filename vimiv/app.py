@@ -10,8 +10,8 @@ import logging
 import os
 from typing import List
 
-from PyQt5.QtCore import QThreadPool
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import QThreadPool, QSize
+from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication
 
 import vimiv
@@ -59,7 +59,8 @@ class Application(QApplication):
     def _icon_from_project_directory(self):
         """Try to retrieve the icon from the icons folder.
 
-        Useful if vimiv was not installed but is used from the git project.
+        Useful if vimiv was not installed but is used from the git project. The files
+        are only registered with the icon, Qt decodes a size once it is first required.
         """
         icon = QIcon()
         file_dir = os.path.realpath(os.path.dirname(__file__))
@@ -67,8 +68,8 @@ class Application(QApplication):
         icon_dir = os.path.join(project_dir, "icons")
         for size in (16, 32, 64, 128, 256, 512):
             path = os.path.join(icon_dir, f"vimiv_{size}x{size}.png")
-            pixmap = QPixmap(path)
-            icon.addPixmap(pixmap)
+            if os.path.isfile(path):
+                icon.addFile(path, QSize(size, size))
         return icon
 
 
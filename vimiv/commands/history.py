@@ -37,8 +37,7 @@ def write(commands):
     """
     filename = xdg.join_vimiv_data("history")
     with open(filename, "w") as f:
-        for command in commands:
-            f.write(command + "\n")
+        f.write("".join(command + "\n" for command in commands))
 
 
 class History(collections.UserList):
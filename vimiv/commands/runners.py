@@ -9,7 +9,8 @@
 Module Attributes:
     external: ExternalRunner instance to run shell commands.
 
-    _last_command: Dictionary storing the last command for each mode.
+    _last_command: List storing the last command for each mode indexed by the mode
+        identifier.
 """
 
 import logging
@@ -17,7 +18,7 @@ import os
 import re
 import shlex
 import subprocess
-from typing import Dict, List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional
 
 from PyQt5.QtCore import QRunnable, QObject, QThreadPool, pyqtSignal
 
@@ -26,7 +27,10 @@ from vimiv.commands import aliases
 from vimiv.utils import pathreceiver
 
 
-_last_command: Dict[api.modes.Mode, "LastCommand"] = {}
+_last_command: List[Optional["LastCommand"]] = [None] * len(api.modes.ALL)
+_percent_expression = re.compile(r"(?<!\\)%m?")  # Unescaped % and %m wildcards
+# Characters which require running external commands within a shell
+_shell_expression = re.compile(r"[|&;<>()$`\\\"'*?\[#~=%{}!\n]")
 
 
 class LastCommand(NamedTuple):
@@ -95,9 +99,10 @@ def repeat_command(count: Optional[int] = None):
     **count:** Repeat count times.
     """
     mode = api.modes.current()
-    if mode not in _last_command:
+    last_command = _last_command[mode.identifier]
+    if last_command is None:
         raise api.commands.CommandError("No command to repeat")
-    stored_count, cmdname, args = _last_command[mode]
+    stored_count, cmdname, args = last_command
     # Prefer entered count over stored count
     count = count if count is not None else stored_count
     _run_command(count, cmdname, args, mode)
@@ -115,9 +120,10 @@ def _run_command(count, cmdname, args, mode):
     try:
         cmd = api.commands.get(cmdname, mode)
         if cmd.store:
-            _last_command[mode] = LastCommand(count, cmdname, args)
-        cmd(args, count=count)
-        api.status.update()
+            _last_command[mode.identifier] = LastCommand(count, cmdname, args)
+        with api.status.batch():  # Only update once, even if the command updates
+            cmd(args, count=count)
+            api.status.update()
     except api.commands.CommandNotFound as e:
         logging.error(str(e))
     except (api.commands.ArgumentError, api.commands.CommandError) as e:
@@ -137,13 +143,13 @@ def _parse(text):
         args: Arguments passed.
     """
     text = text.strip()
-    count = ""
-    split = shlex.split(text)
-    cmdname = split[0]
+    # shlex is only required for quotes and escapes, str.split is much faster
+    if any(char in text for char in "\"'\\"):
+        split = shlex.split(text)
+    else:
+        split = text.split()
     # Receive prepended digits as count
-    while cmdname and cmdname[0].isdigit():
-        count += cmdname[0]
-        cmdname = cmdname[1:]
+    count, cmdname = utils.split_count(split[0])
     args = split[1:]
     return count, cmdname, args
 
@@ -155,13 +161,16 @@ def expand_percent(text, mode):
         text: The command in which the wildcards are expanded.
         mode: Mode the command is run in to get correct path(-list).
     """
-    # Check first as the re substitutions are rather expensive
-    if "%m" in text:
-        text = re.sub(r"(?<!\\)%m", " ".join(api.mark.paths), text)
-    if "%" in text:
-        current = shlex.quote(pathreceiver.current(mode))
-        text = re.sub(r"(?<!\\)%", current, text)
-    return text
+    # Check first as the re substitution is rather expensive
+    if "%" not in text:
+        return text
+
+    def expand(match):
+        if match.group() == "%m":
+            return " ".join(api.mark.paths)
+        return shlex.quote(pathreceiver.current(mode))
+
+    return _percent_expression.sub(expand, text)
 
 
 class ExternalRunner(QObject):
@@ -199,9 +208,10 @@ class ExternalRunner(QObject):
         """
         paths = [path for path in stdout.split("\n") if os.path.exists(path)]
         try:
-            app.open(paths)
-            logging.debug("Opened paths from pipe '%s'", cmd)
-            api.status.update()
+            with api.status.batch():
+                app.open(paths)
+                logging.debug("Opened paths from pipe '%s'", cmd)
+                api.status.update()
         except api.commands.CommandError:
             logging.warning("%s: No paths from pipe", cmd)
 
@@ -230,9 +240,11 @@ class ShellCommandRunnable(QRunnable):
     def run(self):
         """Run shell command on QThreadPool.start(self)."""
         try:
+            # Only spawn a shell if the command requires shell features
+            shell = not self._text or _shell_expression.search(self._text) is not None
             pargs = subprocess.run(
-                self._text,
-                shell=True,
+                self._text if shell else self._text.split(),
+                shell=shell,
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -246,6 +258,8 @@ class ShellCommandRunnable(QRunnable):
         except subprocess.CalledProcessError as e:
             message = e.stderr.decode().split("\n")[0]
             logging.error("%d  %s", e.returncode, message)
+        except OSError as e:  # Executable not found or not runnable without a shell
+            logging.error("%s: %s", self._text.split()[0], e.strerror)
 
 
 def alias(text, mode):
@@ -254,7 +268,8 @@ def alias(text, mode):
     Returns:
         The replaced text if text was an alias else text.
     """
-    cmd = text.split()[0]
-    if cmd in aliases.get(mode):
-        return text.replace(cmd, aliases.get(mode)[cmd])
+    cmd, separator, args = text.partition(" ")
+    aliased = aliases.get(mode).get(cmd)
+    if aliased is not None:
+        return aliased + separator + args
     return text
@@ -58,7 +58,11 @@ class Completer(QObject):
         # Clear selection
         self._completion.selectionModel().clear()
         # Update model
-        self._update_proxy_model(text, lambda model, text: model.on_text_changed(text))
+        self._update_proxy_model(
+            text,
+            lambda model, text: model.on_text_changed(text),
+            always_initialize=False,
+        )
         self._proxy_model.refilter(text)
 
     @utils.slot
@@ -69,17 +73,26 @@ class Completer(QObject):
         self._completion.hide()
 
     def _update_proxy_model(
-        self, text: str, initializer: Callable[[api.completion.BaseModel, str], None]
+        self,
+        text: str,
+        initializer: Callable[[api.completion.BaseModel, str], None],
+        always_initialize: bool = True,
     ):
         """Update completion proxy model depending on text.
 
         Args:
             text: Text in the commandline which defines the model.
             initializer: Callback function to initialize the new proxy model.
+            always_initialize: If False, only call the initializer if the model
+                changed or the model requests it on every text change.
         """
         proxy_model = api.completion.get_module(self._cmd.text())
-        initializer(proxy_model.sourceModel(), proxy_model.strip_text(text))
-        if proxy_model != self._proxy_model:
+        switched = proxy_model is not self._proxy_model
+        source_model = proxy_model.sourceModel()
+        rebuild = getattr(source_model, "REBUILD_ON_TEXT_CHANGE", False)
+        if always_initialize or switched or rebuild:
+            initializer(source_model, proxy_model.strip_text(text))
+        if switched:
             self._proxy_model = proxy_model
             self._completion.setModel(proxy_model)
             self._completion.update_column_widths()
@@ -98,11 +111,8 @@ class Completer(QObject):
         """
         # Get prefix and prepended digits
         cmdtext = self._cmd.text()
-        prefix, cmdtext = cmdtext[0], cmdtext[1:]
-        digits = ""
-        while cmdtext and cmdtext[0].isdigit():
-            digits += cmdtext[0]
-            cmdtext = cmdtext[1:]
+        prefix = cmdtext[0]
+        digits, _ = utils.split_count(cmdtext[1:])
         # Set text in commandline
         self._cmd.setText(prefix + digits + text)
 
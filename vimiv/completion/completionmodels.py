@@ -96,6 +96,8 @@ class PathModel(api.completion.BaseModel):
         _last_directory: Last directory to avoid re-evaluating on every character.
     """
 
+    REBUILD_ON_TEXT_CHANGE = True  # The directory may change with the text
+
     def __init__(self, command):
         super().__init__(f":{command} ", text_filter=StripFilter(command))
         self._command = command
@@ -13,6 +13,7 @@ Module Attributes:
 
 import collections
 import configparser
+import functools
 import logging
 import os
 
@@ -50,6 +51,7 @@ def parse():
     reference.
     """
     global _style
+    _dereference.cache_clear()
     name = api.settings.style.value
     filename = xdg.join_vimiv_config("styles/%s" % (name))
     if name == "default":
@@ -71,10 +73,19 @@ def apply(obj, append=""):
         obj: The QObject to apply the stylesheet to.
         append: Extra string to append to the stylesheet.
     """
-    sheet = obj.STYLESHEET + append
+    obj.setStyleSheet(_dereference(obj.STYLESHEET + append))
+
+
+@functools.lru_cache(maxsize=None)
+def _dereference(sheet):
+    """Return sheet with all style options replaced by their values.
+
+    The result is cached as the same stylesheets are applied repeatedly, e.g. when
+    showing messages in the statusbar. The cache is cleared in parse().
+    """
     for option, value in _style.items():
         sheet = sheet.replace(option, value)
-    obj.setStyleSheet(sheet)
+    return sheet
 
 
 def get(name):
@@ -6,6 +6,7 @@
 
 """Bar widget at the bottom including statusbar and commandline."""
 
+from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtWidgets import QWidget, QStackedLayout, QSizePolicy
 
 from vimiv import api, utils
@@ -18,6 +19,7 @@ class Bar(QWidget):
     Attributes:
         commandline: vimiv.gui.commandline.CommandLine object.
 
+        _always_show: Cached value of the statusbar.show setting.
         _stack: QStackedLayout containing statusbar and commandline.
     """
 
@@ -34,6 +36,7 @@ class Bar(QWidget):
         self._stack.addWidget(self.commandline)
         self._stack.setCurrentWidget(statusbar.statusbar)
 
+        self._always_show = api.settings.statusbar.show.value
         self._maybe_hide()
 
         self.commandline.editingFinished.connect(self._on_editing_finished)
@@ -91,17 +94,19 @@ class Bar(QWidget):
         self._maybe_hide()
         api.modes.COMMAND.leave()
 
+    @pyqtSlot(object)  # Settings emit their value as python object
     def _on_show_changed(self, value: bool):
+        self._always_show = value
         statusbar.statusbar.setVisible(value)
         self._maybe_hide()
 
+    @pyqtSlot(object)
     def _on_timeout_changed(self, value: int):
         statusbar.statusbar.timer.setInterval(value)
 
     def _maybe_hide(self):
         """Hide bar if statusbar is not visible and not in command mode."""
-        always_show = api.settings.statusbar.show.value
-        if not always_show and not self.commandline.hasFocus():
+        if not self._always_show and not self.commandline.hasFocus():
             self.hide()
         else:
             self.show()
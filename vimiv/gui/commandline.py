@@ -6,9 +6,7 @@
 
 """CommandLine widget in the bar."""
 
-from contextlib import suppress
-
-from PyQt5.QtCore import QCoreApplication, QTimer
+from PyQt5.QtCore import QCoreApplication, QMetaObject, QTimer, Qt, Q_ARG, pyqtSlot
 from PyQt5.QtWidgets import QLineEdit
 
 from vimiv import api, utils
@@ -17,16 +15,6 @@ from vimiv.config import styles
 from vimiv.utils import eventhandler
 
 
-def _command_func(prefix, command, mode):
-    """Return callable function for command depending on prefix."""
-    if prefix == ":":
-        return lambda: runners.run(command, mode=mode)
-    # No need to search again if incsearch is enabled
-    if prefix in "/?" and not search.use_incremental(mode):
-        return lambda: search.search(command, mode, reverse=prefix == "?")
-    return lambda: None
-
-
 class UnknownPrefix(Exception):
     """Raised if a prefix in the command line is not known."""
 
@@ -54,6 +42,7 @@ class CommandLine(eventhandler.KeyHandler, QLineEdit):
             which the commandline was entered.
 
         _history: History object to store and interact with history.
+        _incsearch_timer: QTimer to only search incrementally once typing paused.
     """
 
     PREFIXES = ":/?"
@@ -76,11 +65,16 @@ class CommandLine(eventhandler.KeyHandler, QLineEdit):
             history.read(), max_items=api.settings.command_history_limit.value
         )
         self.mode = None
+        self._incsearch_timer = QTimer(self)
+        self._incsearch_timer.setSingleShot(True)
+        self._incsearch_timer.setInterval(50)
+        self._incsearch_timer.timeout.connect(self._incremental_search)
 
         self.returnPressed.connect(self._on_return_pressed)
         self.editingFinished.connect(self._history.reset)
+        self.editingFinished.connect(self._incsearch_timer.stop)
         self.textEdited.connect(self._on_text_edited)
-        self.textChanged.connect(self._incremental_search)
+        self.textChanged.connect(self._incsearch_timer.start)
         self.cursorPositionChanged.connect(self._on_cursor_position_changed)
         QCoreApplication.instance().aboutToQuit.connect(self._on_app_quit)
         api.modes.COMMAND.entered.connect(self._on_entered)
@@ -93,13 +87,30 @@ class CommandLine(eventhandler.KeyHandler, QLineEdit):
         prefix, command = self._split_prefix(self.text())
         if not command:  # Only prefix entered
             return
+        if self._incsearch_timer.isActive():  # Search for the complete text right away
+            self._incsearch_timer.stop()
+            self._incremental_search()
         # Write prefix to history as well for "separate" search history
         self._history.update(prefix + command)
-        # Retrieve function to call depending on prefix
-        func = _command_func(prefix, command, self.mode)
-        # Run commands in QTimer so the command line has been left when the
+        # Queue running the command so the command line has been left when the
         # command runs
-        QTimer.singleShot(0, func)
+        QMetaObject.invokeMethod(
+            self,
+            "_run_deferred",
+            Qt.QueuedConnection,
+            Q_ARG(str, prefix),
+            Q_ARG(str, command),
+            Q_ARG(object, self.mode),
+        )
+
+    @pyqtSlot(str, str, object)
+    def _run_deferred(self, prefix, command, mode):
+        """Run the command queued by _on_return_pressed depending on prefix."""
+        if prefix == ":":
+            runners.run(command, mode=mode)
+        # No need to search again if incsearch is enabled
+        elif not search.use_incremental(mode):
+            search.search(command, mode, reverse=prefix == "?")
 
     def _split_prefix(self, text):
         """Remove prefix from text for command processing.
@@ -126,9 +137,10 @@ class CommandLine(eventhandler.KeyHandler, QLineEdit):
         """Run incremental search if enabled."""
         if not search.use_incremental(self.mode):
             return
-        with suppress(IndexError):  # Not enough text
-            prefix, text = self._split_prefix(self.text())
-            if prefix in "/?" and text:
+        text = self.text()
+        if text[:1] in ("/", "?"):  # Neither empty nor a command
+            prefix, text = text[0], text[1:].strip()
+            if text:
                 search.search(text, self.mode, reverse=prefix == "?", incremental=True)
 
     @utils.slot
@@ -97,8 +97,7 @@ class CompletionView(widgets.FlatTreeView):
             return
         row = row % self.model().rowCount()
         self._select_row(row)
-        index = self.selectionModel().selectedIndexes()[0]
-        completion = index.data()
+        completion = self.model().index(row, 0).data()
         self.activated.emit(completion)
 
     def resizeEvent(self, event):
@@ -108,9 +107,9 @@ class CompletionView(widgets.FlatTreeView):
 
     def update_column_widths(self):
         """Resize columnds according to model."""
-        for i in range(self.model().columnCount()):
-            fraction = self.model().sourceModel().column_widths[i]
-            self.setColumnWidth(i, fraction * self.width())
+        width = self.width()
+        for i, fraction in enumerate(self.model().sourceModel().column_widths):
+            self.setColumnWidth(i, int(fraction * width))
 
 
 def instance():
@@ -6,6 +6,9 @@
 
 """QMainWindow which groups all the other widgets."""
 
+import functools
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QWidget, QStackedLayout
 
 from vimiv import api, utils
@@ -29,7 +32,9 @@ class MainWindow(QWidget):
     Attributes:
         bar: bar.Bar object containing statusbar and command line.
 
-        _overlays: List of overlay widgets.
+        _overlays: Tuple of overlay widgets.
+        _resize_timer: QTimer to update the layout once after a burst of resizes.
+        _title_timer: QTimer to update the title once after a burst of updates.
         _stack: ImageThumbnailLayout as main layout widget.
     """
 
@@ -37,7 +42,14 @@ class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.bar = bar.Bar()
-        self._overlays = []
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._on_resize_finished)
+        self._title_timer = QTimer(self)
+        self._title_timer.setSingleShot(True)
+        self._title_timer.setInterval(0)
+        self._title_timer.timeout.connect(self._set_title)
 
         grid = widgets.SimpleGrid(self)
         self._stack = ImageThumbnailLayout()
@@ -47,17 +59,17 @@ class MainWindow(QWidget):
         grid.addLayout(self._stack, 0, 1, 1, 1)
         grid.addWidget(lib, 0, 0, 1, 1)
         manwidget = manipulate.Manipulate(self)
-        self._overlays.append(manwidget)
         compwidget = completionwidget.CompletionView(self)
-        self._overlays.append(compwidget)
-        self._overlays.append(keyhint_widget.KeyhintWidget(self))
+        keyhint = keyhint_widget.KeyhintWidget(self)
+        self._overlays = (manwidget, compwidget, keyhint)
         grid.addWidget(self.bar, 1, 0, 1, 2)
         # Initialize completer and config commands
         completer.Completer(self.bar.commandline, compwidget)
         configcommands.init()
         self._set_title()
 
-        api.status.signals.update.connect(self._set_title)
+        # Set the title once for all status updates within one event loop iteration
+        api.status.signals.update.connect(self._title_timer.start)
         api.modes.COMMAND.entered.connect(self._update_overlay_geometry)
         api.modes.COMMAND.left.connect(self._update_overlay_geometry)
         api.settings.statusbar.show.changed.connect(self._update_overlay_geometry)
@@ -78,6 +90,11 @@ class MainWindow(QWidget):
             event: The QResizeEvent.
         """
         super().resizeEvent(event)
+        self._resize_timer.start()  # Only relayout once a burst of resizes finished
+
+    @utils.slot
+    def _on_resize_finished(self):
+        """Resize overlays and library to the final size after resizing."""
         self._update_overlay_geometry()
         library.instance().update_width()
 
@@ -86,13 +103,14 @@ class MainWindow(QWidget):
         super().show()
         self._update_overlay_geometry()
 
+    @utils.slot
     def _update_overlay_geometry(self):
         """Update geometry of all overlay widgets according to current layout."""
-        bottom = self.height()
+        width, bottom = self.width(), self.height()
         if self.bar.isVisible():
             bottom -= self.bar.height()
         for overlay in self._overlays:
-            overlay.update_geometry(self.width(), bottom)
+            overlay.update_geometry(width, bottom)
 
     def focusNextPrevChild(self, next_child):
         """Override to do nothing as focusing is handled by modehandler."""
@@ -101,14 +119,19 @@ class MainWindow(QWidget):
     @utils.slot
     def _set_title(self):
         """Update window title depending on mode and settings."""
-        mode = api.modes.current().name
-        try:  # Prefer mode specific setting
-            title = api.settings.get_value("title.%s" % (mode))
-        except KeyError:
-            title = api.settings.get_value("title.fallback")
+        title = _title_setting(api.modes.current()).value
         self.setWindowTitle(api.status.evaluate(title))
 
 
+@functools.lru_cache(maxsize=None)
+def _title_setting(mode):
+    """Return the window title setting used for mode."""
+    try:  # Prefer mode specific setting
+        return api.settings.get("title.%s" % (mode.name))
+    except KeyError:
+        return api.settings.get("title.fallback")
+
+
 def instance():
     return api.objreg.get(MainWindow)
 
@@ -135,8 +158,10 @@ class ImageThumbnailLayout(QStackedLayout):
         # possible to leave for the library
         api.modes.THUMBNAIL.left.connect(self._enter_image)
 
+    @utils.slot
     def _enter_thumbnail(self):
         self.setCurrentWidget(self.thumbnail)
 
+    @utils.slot
     def _enter_image(self):
         self.setCurrentWidget(self.image)
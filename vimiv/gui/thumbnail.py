@@ -6,33 +6,52 @@
 
 """Thumbnail widget."""
 
+import bisect
 import collections
 import logging
 import os
 from typing import List, Optional
 
-from PyQt5.QtCore import Qt, QSize, QItemSelectionModel, QModelIndex, QRect, pyqtSlot
+from PyQt5.QtCore import Qt, QSize, QItemSelectionModel, QModelIndex, QTimer, pyqtSlot
 from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QStyle, QStyledItemDelegate
-from PyQt5.QtGui import QColor, QIcon
+from PyQt5.QtGui import QBrush, QColor, QIcon, QPixmapCache
 
 from vimiv import api, utils, imutils
 from vimiv.commands import argtypes, search
 from vimiv.config import styles
-from vimiv.utils import eventhandler, pixmap_creater, thumbnail_manager, clamp
+from vimiv.utils import eventhandler, pixmap_creater, thumbnail_manager
 
 
-class ThumbnailView(eventhandler.KeyHandler, QListWidget):
+class ThumbnailView(  # pylint: disable=too-many-instance-attributes
+    eventhandler.KeyHandler, QListWidget
+):
     """Thumbnail widget.
 
+    Class Attributes:
+        MAX_ICONS: Maximum number of created thumbnails kept in memory.
+        _shared_default_icon: Default icon shared between all instances.
+
     Attributes:
         _paths: Last paths loaded to avoid duplicate loading.
-        _highlighted: List of indices that are highlighted as search results.
+        _path_rows: Dictionary mapping each path in _paths to its row.
+        _basenames: Basenames of all paths in _paths.
+        _highlighted: Set of indices that are highlighted as search results.
+        _icon_rows: Ordered dictionary of rows displaying a created thumbnail, least
+            recently created first.
+        _visible_rows: Range of rows visible when scrolling stopped including buffer.
         _sizes: Dictionary of thumbnail sizes with integer size as key and
             string name of the size as value.
-        _default_thumb: Thumbnail to display before thumbnails were generated.
+        _default_icon: Icon to display before thumbnails were generated.
         _manager: ThumbnailManager class to create thumbnails asynchronously.
+        _padding: Padding around each thumbnail in pixels.
+        _scrollbar_width: Width of the scrollbar in pixels.
+        _prioritize_timer: QTimer to prioritize visible thumbnails once scrolling
+            stopped.
     """
 
+    MAX_ICONS = 1024
+    _shared_default_icon: Optional[QIcon] = None
+
     STYLESHEET = """
     QListWidget {
         font: {thumbnail.font};
@@ -70,18 +89,38 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
     def __init__(self):
         super().__init__()
         self._paths = []
-        self._highlighted = []
+        self._path_rows = {}
+        self._basenames = []
+        self._highlighted = set()
+        self._icon_rows = collections.OrderedDict()
+        self._visible_rows = range(0)
         self._sizes = collections.OrderedDict(
             [(64, "small"), (128, "normal"), (256, "large"), (512, "x-large")]
         )
-        self._default_icon = QIcon(pixmap_creater.default_thumbnail())
+        if ThumbnailView._shared_default_icon is None:  # Create once for all views
+            ThumbnailView._shared_default_icon = QIcon(
+                pixmap_creater.default_thumbnail()
+            )
+        self._default_icon = ThumbnailView._shared_default_icon
         self._manager = thumbnail_manager.ThumbnailManager()
+        self._padding = int(styles.get("thumbnail.padding").replace("px", ""))
+        self._scrollbar_width = int(
+            styles.get("image.scrollbar.width").replace("px", "")
+        )
+        self._prioritize_timer = QTimer(self)
+        self._prioritize_timer.setSingleShot(True)
+        self._prioritize_timer.setInterval(50)
+        self._prioritize_timer.timeout.connect(self._prioritize_visible)
 
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setViewMode(QListWidget.IconMode)
         default_size = api.settings.thumbnail.size.value
         self.setIconSize(QSize(default_size, default_size))
         self.setResizeMode(QListWidget.Adjust)
+        self.setUniformItemSizes(True)  # All thumbnails share the same size
+        # Lay out items in batches to keep the event loop responsive for large folders
+        self.setLayoutMode(QListWidget.Batched)
+        self.setBatchSize(64)
 
         self.setItemDelegate(ThumbnailDelegate(self))
 
@@ -92,6 +131,7 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
         search.search.cleared.connect(self._on_search_cleared)
         self._manager.created.connect(self._on_thumbnail_created)
         self.activated.connect(self._on_activated)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
         api.mark.marked.connect(self._mark_highlight)
         api.mark.unmarked.connect(lambda path: self._mark_highlight(path, marked=False))
 
@@ -106,26 +146,38 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
         """
         if paths == self._paths:  # Nothing to do
             return
-        # Delete paths that are no longer here
-        # We must go in reverse order as otherwise the indexing changes on the
-        # fly
-        for i, path in enumerate(self._paths[::-1]):
-            if path not in paths:
-                if not self.takeItem(len(self._paths) - 1 - i):
-                    logging.error("Error removing thumbnail for %s", path)
-        # Add new paths
-        for i, path in enumerate(paths):
-            if path not in self._paths:
-                item = QListWidgetItem(self, i)
-                item.setSizeHint(QSize(self.item_size(), self.item_size()))
-                item.setIcon(self._default_icon)
+        # Sets for fast membership tests on large directories
+        new_paths, old_paths = set(paths), set(self._paths)
+        self.setUpdatesEnabled(False)  # Redraw once after all items were changed
+        try:
+            # Delete paths that are no longer here
+            # We must go in reverse order as otherwise the indexing changes on the
+            # fly
+            for i in reversed(range(len(self._paths))):
+                path = self._paths[i]
+                if path not in new_paths:
+                    if not self.takeItem(i):
+                        logging.error("Error removing thumbnail for %s", path)
+            # Add new paths
+            size_hint = QSize(self.item_size(), self.item_size())
+            for i, path in enumerate(paths):
+                if path not in old_paths:
+                    item = QListWidgetItem(self, i)
+                    item.setSizeHint(size_hint)
+                    item.setIcon(self._default_icon)
+        finally:
+            self.setUpdatesEnabled(True)
         # Update paths and create thumbnails
         self._paths = paths
+        self._path_rows = {path: i for i, path in enumerate(paths)}
+        self._icon_rows.clear()  # Rows changed, all thumbnails are created again
+        self._basenames = [os.path.basename(path) for path in paths]
         self._manager.create_thumbnails_async(paths)
+        self._prioritize_timer.start()
 
     @utils.slot
     def _on_new_image_opened(self, path: str):
-        self._select_item(self._paths.index(path))
+        self._select_item(self._path_rows[path])
 
     @utils.slot
     def _on_activated(self, index: QModelIndex):
@@ -145,8 +197,22 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
             icon: QIcon to insert.
         """
         item = self.item(index)
-        if item is not None:  # Otherwise it has been deleted in the meanwhile
-            item.setIcon(icon)
+        if item is None:  # It has been deleted in the meanwhile
+            return
+        item.setIcon(icon)
+        self._icon_rows[index] = None
+        self._icon_rows.move_to_end(index)
+        # Drop the least recently created thumbnails from memory, they are created
+        # again from the thumbnail cache on disk once they become visible
+        for _ in range(len(self._icon_rows) - self.MAX_ICONS):
+            row = next(iter(self._icon_rows))
+            del self._icon_rows[row]
+            if row in self._visible_rows:  # Keep thumbnails that are shown
+                self._icon_rows[row] = None
+                continue
+            evicted = self.item(row)
+            if evicted is not None:  # It has been deleted in the meanwhile
+                evicted.setIcon(self._default_icon)
 
     @pyqtSlot(int, list, api.modes.Mode, bool)
     def _on_new_search(
@@ -160,19 +226,54 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
             mode: Mode for which the search was performed.
             incremental: True if incremental search was performed.
         """
-        self._highlighted = []
+        previous = self._highlighted
+        self._highlighted = set()
         if self._paths and mode == api.modes.THUMBNAIL:
             self._select_item(index)
-            for i, path in enumerate(self._paths):
-                if os.path.basename(path) in matches:
-                    self._highlighted.append(i)
-            self.repaint()
+            match_set = set(matches)
+            self._highlighted = {
+                i for i, basename in enumerate(self._basenames) if basename in match_set
+            }
+        self._update_rows(previous ^ self._highlighted)
 
     @utils.slot
     def _on_search_cleared(self):
-        """Reset highlighted and force repaint when search results cleared."""
-        self._highlighted = []
-        self.repaint()
+        """Reset highlighted and repaint highlighted items when search was cleared."""
+        previous = self._highlighted
+        self._highlighted = set()
+        self._update_rows(previous)
+
+    @utils.slot
+    def _on_scrolled(self, _value: int):
+        """Prioritize the visible thumbnails once scrolling stopped."""
+        self._prioritize_timer.start()  # Must not pass the value as interval
+
+    @utils.slot
+    def _prioritize_visible(self):
+        """Create thumbnails of the visible rows and two rows around them first."""
+        rect = self.viewport().rect()
+        first = self.indexAt(rect.topLeft()).row()
+        if first == -1:  # No thumbnails
+            return
+        last = self.indexAt(rect.bottomRight()).row()
+        if last == -1:  # Empty space after the last thumbnail
+            last = self.count() - 1
+        buffer = 2 * max(self.columns(), 1)
+        rows = range(max(first - buffer, 0), min(last + buffer, self.count() - 1) + 1)
+        self._visible_rows = rows
+        self._manager.prioritize(
+            {row: self._paths[row] for row in rows if row not in self._icon_rows}
+        )
+
+    def _update_rows(self, rows):
+        """Schedule a repaint of the items in the given rows.
+
+        Args:
+            rows: Iterable of row numbers whose items changed.
+        """
+        model = self.model()
+        for row in rows:
+            self.update(model.index(row, 0))
 
     def _mark_highlight(self, path: str, marked: bool = True):
         """(Un-)Highlight a path if it was (un-)marked.
@@ -181,9 +282,8 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
             path: The (un-)marked path.
             marked: True if it was marked.
         """
-        try:
-            index = self._paths.index(path)
-        except ValueError:
+        index = self._path_rows.get(path)
+        if index is None:
             return
         item = self.item(index)
         # Set arbitrary text as the mark is highlighted by a rectangle
@@ -273,15 +373,19 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
         **count:** multiplier
         """
         size = self.iconSize().width()
-        size = size // 2 if direction == direction.Out else size * 2
-        size = clamp(size, 64, 512)
-        api.settings.thumbnail.size.value = size
+        sizes = list(self._sizes)
+        if direction == direction.Out:
+            new_size = sizes[max(bisect.bisect_left(sizes, size) - 1, 0)]
+        else:
+            new_size = sizes[min(bisect.bisect_right(sizes, size), len(sizes) - 1)]
+        if new_size != size:  # Avoid a full relayout when already at the limit
+            api.settings.thumbnail.size.value = new_size
 
     def rescale_items(self):
         """Reset item hint when item size has changed."""
+        size_hint = QSize(self.item_size(), self.item_size())
         for i in range(self.count()):
-            item = self.item(i)
-            item.setSizeHint(QSize(self.item_size(), self.item_size()))
+            self.item(i).setSizeHint(size_hint)
         self.scrollTo(self.selectionModel().currentIndex(), hint=self.PositionAtCenter)
 
     def _select_item(self, index):
@@ -309,20 +413,17 @@ class ThumbnailView(eventhandler.KeyHandler, QListWidget):
 
     def columns(self):
         """Return the number of columns."""
-        sb_width = int(styles.get("image.scrollbar.width").replace("px", ""))
-        return (self.width() - sb_width) // self.item_size()
+        return (self.width() - self._scrollbar_width) // self.item_size()
 
     def item_size(self):
         """Return the size of one icon including padding."""
-        padding = int(styles.get("thumbnail.padding").replace("px", ""))
-        return self.iconSize().width() + 2 * padding
+        return self.iconSize().width() + 2 * self._padding
 
     @api.status.module("{thumbnail-name}")
     def current(self):
         """Name of the currently selected thumbnail."""
         try:
-            abspath = self._paths[self.currentRow()]
-            basename = os.path.basename(abspath)
+            basename = self._basenames[self.currentRow()]
             name, _ = os.path.splitext(basename)
             return name
         except IndexError:
@@ -365,15 +466,13 @@ class ThumbnailDelegate(QStyledItemDelegate):
     def __init__(self, parent):
         super().__init__(parent)
 
-        # QColor options for background drawing
-        self.bg = QColor()
-        self.bg.setNamedColor(styles.get("thumbnail.bg"))
-        self.selection_bg = QColor()
-        self.selection_bg.setNamedColor(styles.get("thumbnail.selected.bg"))
-        self.search_bg = QColor()
-        self.search_bg.setNamedColor(styles.get("thumbnail.search.highlighted.bg"))
-        self.mark_bg = QColor()
-        self.mark_bg.setNamedColor(styles.get("mark.color"))
+        # Leave room for the scaled pixmaps of many thumbnails, the size is in KiB
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 51200))
+        # QBrush options for background drawing, created once instead of per paint
+        self.bg = QBrush(QColor(styles.get("thumbnail.bg")))
+        self.selection_bg = QBrush(QColor(styles.get("thumbnail.selected.bg")))
+        self.search_bg = QBrush(QColor(styles.get("thumbnail.search.highlighted.bg")))
+        self.mark_bg = QBrush(QColor(styles.get("mark.color")))
         self.padding = int(styles.get("thumbnail.padding"))
 
     def paint(self, painter, option, index):
@@ -384,8 +483,12 @@ class ThumbnailDelegate(QStyledItemDelegate):
             option: The QStyleOptionViewItem.
             index: The QModelIndex.
         """
+        # Save the painter state once, all drawn shapes are filled without outline
+        painter.save()
+        painter.setPen(Qt.NoPen)
         self._draw_background(painter, option, index)
         self._draw_pixmap(painter, option, index)
+        painter.restore()
 
     def _draw_background(self, painter, option, index):
         """Draw the background rectangle of the thumbnail.
@@ -398,12 +501,8 @@ class ThumbnailDelegate(QStyledItemDelegate):
             option: The QStyleOptionViewItem.
             index: The QModelIndex.
         """
-        color = self._get_background_color(index, option.state)
-        painter.save()
-        painter.setBrush(color)
-        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._get_background_brush(index, option.state))
         painter.drawRect(option.rect)
-        painter.restore()
 
     def _draw_pixmap(self, painter, option, index):
         """Draw the actual pixmap of the thumbnail.
@@ -416,27 +515,54 @@ class ThumbnailDelegate(QStyledItemDelegate):
             option: The QStyleOptionViewItem.
             index: The QModelIndex.
         """
-        painter.save()
         # Original thumbnail pixmap
-        pixmap = self.parent().item(index.row()).icon().pixmap(256)
-        # Rectangle that can be filled by the pixmap
-        rect = QRect(
-            option.rect.x() + self.padding,
-            option.rect.y() + self.padding,
-            option.rect.width() - 2 * self.padding,
-            option.rect.height() - 2 * self.padding,
-        )
-        # Size the pixmap should take
-        size = pixmap.size().scaled(rect.size(), Qt.KeepAspectRatio)
+        icon = index.data(Qt.DecorationRole)
+        if icon is None:  # Nothing to draw
+            return
+        pixmap = icon.pixmap(256)
+        pixmap_width, pixmap_height = pixmap.width(), pixmap.height()
+        if not pixmap_width or not pixmap_height:  # Nothing to draw
+            return
+        # Size that can be filled by the pixmap
+        rect = option.rect
+        width = rect.width() - 2 * self.padding
+        height = rect.height() - 2 * self.padding
+        # Size the pixmap should take keeping the aspect ratio, same as QSize.scaled
+        scaled_width = height * pixmap_width // pixmap_height
+        if scaled_width <= width:
+            width = scaled_width
+        else:
+            height = width * pixmap_height // pixmap_width
+        pixmap = self._scaled_pixmap(pixmap, width, height)
         # Coordinates to center the pixmap
-        diff_x = (rect.width() - size.width()) / 2.0
-        diff_y = (rect.height() - size.height()) / 2.0
-        x = option.rect.x() + self.padding + diff_x
-        y = option.rect.y() + self.padding + diff_y
+        x = rect.x() + self.padding + (rect.width() - 2 * self.padding - width) // 2
+        y = rect.y() + self.padding + (rect.height() - 2 * self.padding - height) // 2
         # Draw
-        painter.drawPixmap(x, y, size.width(), size.height(), pixmap)
-        painter.restore()
-        self._draw_mark(painter, index, option, x + size.width(), y + size.height())
+        painter.drawPixmap(x, y, pixmap)
+        self._draw_mark(painter, index, option, x + width, y + height)
+
+    @staticmethod
+    def _scaled_pixmap(pixmap, width, height):
+        """Return pixmap scaled to width and height re-using scaled pixmaps.
+
+        Scaling once and caching the result avoids rescaling the full thumbnail on
+        every paint, e.g. when scrolling.
+
+        Args:
+            pixmap: The original thumbnail QPixmap.
+            width: The width the pixmap is drawn with.
+            height: The height the pixmap is drawn with.
+        """
+        if pixmap.width() == width and pixmap.height() == height:  # Already fits
+            return pixmap
+        key = "thumbnail-%d-%dx%d" % (pixmap.cacheKey(), width, height)
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            scaled = pixmap.scaled(
+                width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, scaled)
+        return scaled
 
     def _draw_mark(self, painter, index, option, x, y):
         """Draw small rectangle as mark indicator if the image is marked.
@@ -448,21 +574,18 @@ class ThumbnailDelegate(QStyledItemDelegate):
             x: x-coordinate at which the pixmap ends.
             y: y-coordinate at which the pixmap ends.
         """
-        if not index.model().data(index):  # Thumbnail not marked
+        if not index.data():  # Thumbnail not marked
             return
         # Try to set 5 % of width, reduce to padding if this is smaller
         # At least 4px width
         width = max(min(0.05 * option.rect.width(), self.padding), 4)
-        painter.save()
         painter.setBrush(self.mark_bg)
-        painter.setPen(Qt.NoPen)
         painter.drawRect(x - 0.5 * width, y - 0.5 * width, width, width)
-        painter.restore()
 
-    def _get_background_color(self, index, state):
-        """Return the background color of an item.
+    def _get_background_brush(self, index, state):
+        """Return the background brush of an item.
 
-        The color depends on selected and highlighted as search result.
+        The brush depends on selected and highlighted as search result.
 
         Args:
             index: Index of the element indicating even/odd/highlighted.
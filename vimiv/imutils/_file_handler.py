@@ -6,13 +6,22 @@
 
 """Classes to deal with the actual image file."""
 
+import functools
 import logging
 import os
 import tempfile
-from typing import List
-
-from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QCoreApplication
-from PyQt5.QtGui import QPixmap, QImageReader, QMovie
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import (
+    QBuffer,
+    QIODevice,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QCoreApplication,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QImageWriter, QMovie
 
 from vimiv import api, utils, imutils
 from vimiv.imutils import imtransform, immanipulate
@@ -24,6 +33,9 @@ try:
 except ImportError:
     QSvgWidget = None
 
+# Formats written reliably by QImageWriter that do not need to be verified after writing
+_SAFE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".tif"}
+
 
 class Pixmaps:
     """Simple storage class for different pixmap versions.
@@ -39,14 +51,15 @@ class Pixmaps:
     transformed = None
 
 
-class ImageFileHandler(QObject):
+class ImageFileHandler(QObject):  # pylint: disable=too-many-instance-attributes
     """Handler to load and write images.
 
     The handler connects to the new_image_opened signal to retrieve the path of
     the current image. This path is opened with QImageReader and depending on
     the type of image one of the loaded signals is emitted with the generated
-    QWidget. In addition to the loading the file handler provides a write
-    command and is able to automatically write changes from transform or
+    QWidget. Regular images are decoded in an extra thread to keep the user
+    interface responsive. In addition to the loading the file handler provides a
+    write command and is able to automatically write changes from transform or
     manipulate to file if wanted.
 
     Attributes:
@@ -54,9 +67,26 @@ class ImageFileHandler(QObject):
         manipulate: Manipulate class for e.g. brightness.
 
         _path: Path to the currently loaded QObject.
+        _read_id: Id of the latest load, results of older reads are discarded.
+        _loading: True while the latest image requested is read in an extra thread.
         _pixmaps: Pixmaps object storing different version of the loaded image.
+        _bad_paths: Paths that could not be loaded mapped to their modification time
+            and error message.
+
+    Signals:
+        image_read: Emitted by ReadImageRunner with the decoded QImage, its path,
+            reload_only and the id of the read.
+        image_read_failed: Emitted by ReadImageRunner with the path, its
+            modification time, the error message and the id of the read if
+            reading failed.
+        loaded: Emitted with the path once an image read in an extra thread was
+            displayed or failed to load.
     """
 
+    image_read = pyqtSignal(QImage, str, bool, int)
+    image_read_failed = pyqtSignal(str, float, str, int)
+    loaded = pyqtSignal(str)
+
     _pool = QThreadPool.globalInstance()
 
     @api.objreg.register
@@ -68,12 +98,22 @@ class ImageFileHandler(QObject):
         self.manipulate = immanipulate.Manipulator(self)
 
         self._path = ""
+        self._read_id = 0
+        self._loading = False
+        self._bad_paths: Dict[str, Tuple[float, str]] = {}
 
+        self.image_read.connect(self._on_image_read)
+        self.image_read_failed.connect(self._on_image_read_failed)
         imutils.new_image_opened.connect(self._on_new_image_opened)
         imutils.all_images_cleared.connect(self._on_images_cleared)
         imutils.image_changed.connect(self.reload)
         QCoreApplication.instance().aboutToQuit.connect(self._on_quit)
 
+    @property
+    def loading(self) -> bool:
+        """True while the latest image requested is read in an extra thread."""
+        return self._loading
+
     @property
     def current(self):
         """The currently displayed pixmap.
@@ -125,6 +165,8 @@ class ImageFileHandler(QObject):
     def _on_images_cleared(self):
         """Reset to default when all images were cleared."""
         self._path = ""
+        self._read_id += 1  # Discard results of any running reads
+        self._loading = False
         self.original = None
 
     @api.commands.register(mode=api.modes.IMAGE)
@@ -153,18 +195,27 @@ class ImageFileHandler(QObject):
         """Load proper displayable QWidget for a path.
 
         This reads the image using QImageReader and then emits the appropriate
-        *_loaded signal to tell the image to display a new object.
+        *_loaded signal to tell the image to display a new object. Regular images
+        are read by a ReadImageRunner in an extra thread and finished in
+        _on_image_read.
         """
+        self._read_id += 1  # Discard results of any previous reads
+        self._loading = False
+        mtime = os.path.getmtime(path)
+        bad_path = self._bad_paths.get(path)
+        if bad_path is not None and bad_path[0] == mtime:  # Known to fail, skip probing
+            logging.error(bad_path[1])
+            return
         # Pass file format explicitly as imghdr does a much better job at this than the
         # file name based approach of QImageReader
-        file_format = files.imghdr.what(path)
+        file_format = _image_format(path, mtime)
         if file_format is None:
-            logging.error("%s is not a valid image", path)
+            self._fail(path, mtime, "%s is not a valid image" % (path))
             return
         reader = QImageReader(path, file_format.encode("utf-8"))
         reader.setAutoTransform(True)  # Automatically apply exif orientation
         if not reader.canRead():
-            logging.error("Cannot read image %s", path)
+            self._fail(path, mtime, "Cannot read image %s" % (path))
             return
         # SVG
         if file_format == "svg" and QSvgWidget:
@@ -176,19 +227,72 @@ class ImageFileHandler(QObject):
         elif reader.supportsAnimation():
             movie = QMovie(path)
             if not movie.isValid() or movie.frameCount() == 0:
-                logging.error("Error reading animation %s: invalid data", path)
+                message = "Error reading animation %s: invalid data" % (path)
+                self._fail(path, mtime, message)
                 return
             self.original = movie
             imutils.movie_loaded.emit(self.current, reload_only)
         # Regular image
         else:
-            pixmap = QPixmap.fromImageReader(reader)
-            if reader.error():
-                logging.error("Error reading image %s: %s", path, reader.errorString())
-                return
-            self.original = pixmap
-            imutils.pixmap_loaded.emit(self.current, reload_only)
+            runner = ReadImageRunner(
+                path, mtime, file_format, reload_only, self._read_id, self
+            )
+            self._loading = True
+            self._pool.start(runner)
+            return
+        self._path = path
+        self._bad_paths.pop(path, None)
+
+    @utils.slot
+    def _on_image_read(
+        self, image: QImage, path: str, reload_only: bool, read_id: int
+    ):
+        """Display an image once it was read by a ReadImageRunner.
+
+        Args:
+            image: The QImage read.
+            path: Path to the image file.
+            reload_only: True if the image was reloaded.
+            read_id: Id of the load that started the read.
+        """
+        if read_id != self._read_id:  # Another image was requested in the meantime
+            return
+        self._loading = False
+        # Any edits made while reading were applied to the previous pixmap
+        self._reset()
+        self.original = QPixmap.fromImage(image)
+        imutils.pixmap_loaded.emit(self.current, reload_only)
         self._path = path
+        self._bad_paths.pop(path, None)
+        self.loaded.emit(path)
+
+    @utils.slot
+    def _on_image_read_failed(
+        self, path: str, mtime: float, message: str, read_id: int
+    ):
+        """Remember a path that could not be read and keep the current image.
+
+        Args:
+            path: Path to the image file.
+            mtime: Modification time of the image file.
+            message: Error message to log.
+            read_id: Id of the load that started the read.
+        """
+        self._fail(path, mtime, message)
+        if read_id == self._read_id:
+            self._loading = False
+            self.loaded.emit(path)
+
+    def _fail(self, path: str, mtime: float, message: str) -> None:
+        """Log message and remember path as unreadable until it is modified.
+
+        Args:
+            path: Path to the image file that could not be loaded.
+            mtime: Modification time of the image file.
+            message: Error message to log.
+        """
+        logging.error(message)
+        self._bad_paths[path] = (mtime, message)
 
     def _reset(self):
         self.transform.reset()
@@ -220,6 +324,57 @@ class ImageFileHandler(QObject):
         self._reset()
 
 
+@functools.lru_cache(maxsize=4096)
+def _image_format(path: str, _mtime: float) -> Optional[str]:
+    """Return the image format of path.
+
+    The modification time is only part of the cache key so the format is detected again
+    once the file was changed.
+    """
+    return files.imghdr.what(path)
+
+
+class ReadImageRunner(QRunnable):
+    """Read QImage from file in an extra thread.
+
+    The QImage is sent back to the file handler using its image_read signal as
+    QPixmap may only be created in the main thread. Errors are sent using the
+    image_read_failed signal.
+
+    Attributes:
+        _path: Path to the image file.
+        _mtime: Modification time of the image file.
+        _file_format: Format of the image file.
+        _reload_only: True if the image is reloaded.
+        _read_id: Id of the load that started this read.
+        _handler: The ImageFileHandler object used for callback.
+    """
+
+    def __init__(self, path, mtime, file_format, reload_only, read_id, handler):
+        super().__init__()
+        self._path = path
+        self._mtime = mtime
+        self._file_format = file_format
+        self._reload_only = reload_only
+        self._read_id = read_id
+        self._handler = handler
+
+    def run(self):
+        """Read image and emit the handlers image_read signal."""
+        reader = QImageReader(self._path, self._file_format.encode("utf-8"))
+        reader.setAutoTransform(True)  # Automatically apply exif orientation
+        image = reader.read()
+        if reader.error():
+            message = "Error reading image %s: %s" % (self._path, reader.errorString())
+            self._handler.image_read_failed.emit(
+                self._path, self._mtime, message, self._read_id
+            )
+            return
+        self._handler.image_read.emit(
+            image, self._path, self._reload_only, self._read_id
+        )
+
+
 class WriteImageRunner(QRunnable):
     """Write QPixmap to file in an extra thread.
 
@@ -270,17 +425,26 @@ class WriteImageRunner(QRunnable):
         """Write pixmap to disk."""
         # Get pixmap type
         _, ext = os.path.splitext(self._path)
+        # Encode in memory so the file only needs to be written once
+        buf = QBuffer()
+        buf.open(QIODevice.WriteOnly)
+        writer = QImageWriter(buf, ext.lstrip(".").encode("utf-8"))
+        if not writer.write(self._pixmap.toImage()):
+            raise WriteError(
+                "Error writing %s: %s. Is the extension valid?"
+                % (self._path, writer.errorString())
+            )
         # First create temporary file and then move it to avoid race conditions
         handle, filename = tempfile.mkstemp(dir=os.getcwd(), suffix=ext)
-        os.close(handle)
-        self._pixmap.save(filename)
+        with os.fdopen(handle, "wb") as f:
+            f.write(buf.data())
         # Copy exif info from original file to new file
         imutils.exif.copy_exif(self._original_path, filename)
         os.rename(filename, self._path)
         # Check if valid image was created
         if not os.path.isfile(self._path):
             raise WriteError("File not written, unknown exception")
-        if not files.is_image(self._path):
+        if ext.lower() not in _SAFE_EXTENSIONS and not files.is_image(self._path):
             os.remove(self._path)
             raise WriteError("No valid image written. Is the extention valid?")
 
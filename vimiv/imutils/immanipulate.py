@@ -7,10 +7,16 @@
 """Perform more complex manipulations like brightness and contrast."""
 
 import collections
-import time
 from typing import Optional
 
-from PyQt5.QtCore import QRunnable, QThreadPool, pyqtSignal, QObject, QCoreApplication
+from PyQt5.QtCore import (
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    QObject,
+    QCoreApplication,
+)
 from PyQt5.QtGui import QPixmap, QImage
 
 from vimiv import api, utils
@@ -22,6 +28,11 @@ from vimiv.utils import clamp
 
 
 WAIT_TIME = 0.3
+_PACKED_FORMATS = (
+    QImage.Format_RGB32,
+    QImage.Format_ARGB32,
+    QImage.Format_ARGB32_Premultiplied,
+)
 
 
 class Manipulator(QObject):
@@ -38,6 +49,8 @@ class Manipulator(QObject):
 
         _handler: ImageFileHandler used to retrieve and set updated files.
         _current: Name of the manipulation that is currently being edited.
+        _timer: QTimer to only start manipulating once the user stopped editing.
+        _cancel: Flag passed to the C extension to cancel the running manipulation.
     """
 
     pool = QThreadPool()
@@ -52,8 +65,12 @@ class Manipulator(QObject):
             [("brightness", 0), ("contrast", 0)]
         )
         self.thread_id = 0
+        self._cancel = bytearray(1)
         self.data = None
         self._current = "brightness"
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._start_runner)
         QCoreApplication.instance().aboutToQuit.connect(self._on_quit)
 
     def set_pixmap(self, pixmap):
@@ -62,7 +79,7 @@ class Manipulator(QObject):
 
     def changed(self):
         """Return True if anything was edited."""
-        return self.manipulations != {"brightness": 0, "contrast": 0}
+        return any(self.manipulations.values())
 
     @api.keybindings.register("<return>", "accept", mode=api.modes.MANIPULATE)
     @api.commands.register(mode=api.modes.MANIPULATE)
@@ -185,14 +202,22 @@ class Manipulator(QObject):
             value = clamp(value, -127, 127)
             self.edited.emit(name, value)
             self.manipulations[name] = value
-            self.thread_id += 1
-            runnable = ManipulateRunner(self, self.thread_id)
-            self.pool.start(runnable)
+            # Wait for a bit in case user holds down key
+            self._timer.start(int(WAIT_TIME * 1000))
+
+    @utils.slot
+    def _start_runner(self):
+        """Apply the current manipulations in an extra thread."""
+        self._cancel[0] = 1  # The running manipulation is outdated
+        self._cancel = bytearray(1)
+        self.thread_id += 1
+        runnable = ManipulateRunner(self, self.thread_id, self._cancel)
+        self.pool.start(runnable)
 
     @api.status.module("{processing}")
     def _processing_indicator(self):
         """Print ``processing...`` if manipulations are running."""
-        if self.pool.activeThreadCount():
+        if self._timer.isActive() or self.pool.activeThreadCount():
             return "processing..."
         return ""
 
@@ -203,8 +228,11 @@ class Manipulator(QObject):
     @utils.slot
     def _on_quit(self):
         """Finish thread pool on quit."""
+        self._timer.stop()
+        self._cancel[0] = 1  # Stops the running manipulation after the current chunk
+        self.thread_id += 1  # Running manipulations discard their result
         self.pool.clear()
-        self.pool.waitForDone(5000)  # Kill manipulate after 5s
+        self.pool.waitForDone(5000)
 
 
 def instance():
@@ -217,37 +245,39 @@ class ManipulateRunner(QRunnable):
     Attributes:
         _manipulator: Manipulator class to interact with.
         _id: Integer id of this thread.
+        _cancel: Flag set by the manipulator to cancel this manipulation.
     """
 
-    def __init__(self, manipulator, thread_id):
+    def __init__(self, manipulator, thread_id, cancel):
         super().__init__()
         self._manipulator = manipulator
         self._id = thread_id
+        self._cancel = cancel
 
     def run(self):
         """Apply manipulations."""
+        if self._id != self._manipulator.thread_id:  # Cancelled before starting
+            return
         # Retrieve current unmanipulated image
         image = self._manipulator.unmanipulated()
-        # Wait for a bit in case user holds down key
-        time.sleep(WAIT_TIME)
-        if self._id != self._manipulator.thread_id:
-            return
-        # Convert original pixmap to python bytes
+        # The C function works on the flat buffer of 32 bit pixels without any padding
+        if image.format() not in _PACKED_FORMATS:
+            image = image.convertToFormat(QImage.Format_ARGB32)
+        # Pass the image memory to the C function without copying it to bytes
         bits = image.constBits()
         bits.setsize(image.byteCount())
-        data = bytes(bits)
         # Run C function
         bri = self._manipulator.manipulations["brightness"] / 255
         con = self._manipulator.manipulations["contrast"] / 255
-        self._manipulator.data = _c_manipulate.manipulate(
-            data, image.hasAlphaChannel(), bri, con
+        data = _c_manipulate.manipulate(
+            bits, image.hasAlphaChannel(), bri, con, self._cancel
         )
+        # Cancelled or a newer manipulation started
+        if data is None or self._id != self._manipulator.thread_id:
+            return
         # Convert bytes to QPixmap and set the manipulator pixmap
+        self._manipulator.data = data
         new_image = QImage(
-            self._manipulator.data,
-            image.width(),
-            image.height(),
-            image.bytesPerLine(),
-            image.format(),
+            data, image.width(), image.height(), image.bytesPerLine(), image.format()
         )
         self._manipulator.set_pixmap(QPixmap(new_image))
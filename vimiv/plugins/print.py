@@ -10,7 +10,7 @@ import abc
 import logging
 from typing import cast, Optional, Union
 
-from PyQt5.QtCore import QObject, Qt, QSize
+from PyQt5.QtCore import QObject, Qt, QPoint, QRect, QSize
 from PyQt5.QtGui import QPixmap, QMovie, QPainter
 from PyQt5.QtPrintSupport import QPrintDialog, QPrintPreviewDialog, QPrinter
 
@@ -151,6 +151,7 @@ class PrintMovie(PrintWidget):
         """Paint every frame of the movie on one printer page."""
         logging.debug("Painting animation for print")
         painter = QPainter(printer)
+        page_size = printer.pageRect().size()
 
         for frame in range(self._widget.frameCount()):  # Iterate over all frames
             logging.debug("Painting frame %d", frame)
@@ -160,10 +161,10 @@ class PrintMovie(PrintWidget):
                 printer.newPage()
 
             self._widget.jumpToFrame(frame)
-            pixmap = self._widget.currentPixmap().scaled(
-                printer.pageRect().size(), Qt.KeepAspectRatio
-            )
-            painter.drawPixmap(0, 0, pixmap)
+            pixmap = self._widget.currentPixmap()
+            # Let the painter scale the frame instead of creating a scaled copy
+            size = pixmap.size().scaled(page_size, Qt.KeepAspectRatio)
+            painter.drawPixmap(QRect(QPoint(0, 0), size), pixmap)
 
         painter.end()
 
@@ -6,16 +6,15 @@
 
 """Various utility functions."""
 
-import cProfile
 import functools
 import inspect
+import itertools
 import logging
 import re
+import time
 from abc import ABCMeta
-from contextlib import contextmanager, suppress
-from datetime import datetime
-from pstats import Stats
-from typing import Callable, Optional, TypeVar, List, Any
+from contextlib import contextmanager
+from typing import Callable, Optional, TypeVar, List, Any, Tuple
 
 from PyQt5.QtCore import pyqtSlot
 
@@ -28,6 +27,9 @@ except ImportError:
 
 Number = TypeVar("Number", int, float)
 
+_count_expression = re.compile(r"([0-9]*)(.*)", re.DOTALL)
+_html_expression = re.compile("<.*?>")
+
 
 def add_html(tag: str, text: str) -> str:
     """Surround text in a html tag.
@@ -57,18 +59,19 @@ def strip_html(text: str) -> str:
     Returns:
         The stripped text.
     """
-    stripper = re.compile("<.*?>")
-    return re.sub(stripper, "", text)
+    if "<" not in text:  # Nothing to strip, the common case for status texts
+        return text
+    return _html_expression.sub("", text)
 
 
 def clamp(
     value: Number, minimum: Optional[Number], maximum: Optional[Number]
 ) -> Number:
     """Clamp a value so it does not exceed boundaries."""
-    if minimum is not None:
-        value = max(value, minimum)
-    if maximum is not None:
-        value = min(value, maximum)
+    if minimum is not None and value < minimum:
+        value = minimum
+    if maximum is not None and value > maximum:
+        value = maximum
     return value
 
 
@@ -91,22 +94,27 @@ def is_method(func):
 
 
 def cached_method(func):
-    """Decorator to cache the result of a class method."""
+    """Decorator to cache the result of a class method.
+
+    The results are stored per instance and keyed by the arguments passed, which must
+    therefore be hashable.
+    """
     attr_name = "_lazy_" + func.__name__
 
-    @property
     @functools.wraps(func)
-    def _lazyprop(self):
-        def inner(*args, **kwargs):
-            # Store the result of the function to attr_name in first
-            # evaluation, afterwards return the cached value
-            if not hasattr(self, attr_name):
-                setattr(self, attr_name, func(self, *args, **kwargs))
-            return getattr(self, attr_name)
-
-        return inner
+    def inner(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            cache = self.__dict__[attr_name]
+        except KeyError:
+            cache = self.__dict__[attr_name] = {}
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = func(self, *args, **kwargs)
+            return result
 
-    return _lazyprop
+    return inner
 
 
 class AnnotationNotFound(Exception):
@@ -120,33 +128,35 @@ class AnnotationNotFound(Exception):
         super().__init__(message)
 
 
-def _slot_args(argspec, function):
+def _slot_args(function):
     """Create arguments for pyqtSlot from function arguments.
 
+    The positional arguments are read from the code object directly as this is much
+    cheaper than using inspect for every decorated function at import time.
+
     Args:
-        argspec: Function arguments retrieved via inspect.
         function: The python function for which the arguments are created.
     Returns:
         List of types of the function arguments as arguments for pyqtSlot.
     """
+    code = function.__code__
+    annotations = function.__annotations__
     slot_args = []
-    for argument in argspec.args:
-        has_annotation = argument in argspec.annotations
+    for argument in code.co_varnames[: code.co_argcount]:
+        has_annotation = argument in annotations
         if argument == "self" and not has_annotation:
             continue
         if not has_annotation:
             raise AnnotationNotFound(argument, function)
-        annotation = argspec.annotations[argument]
-        slot_args.append(annotation)
+        slot_args.append(annotations[argument])
     return slot_args
 
 
-def _slot_kwargs(argspec):
+def _slot_kwargs(function):
     """Add return type to slot kwargs if it exists."""
-    with suppress(KeyError):
-        return_type = argspec.annotations["return"]
-        if return_type is not None:
-            return {"result": return_type}
+    return_type = function.__annotations__.get("return")
+    if return_type is not None:
+        return {"result": return_type}
     return {}
 
 
@@ -161,15 +171,14 @@ def slot(function):
         def function(self, x: int, y: int) -> None:
         ...
     """
-    argspec = inspect.getfullargspec(function)
-    slot_args, slot_kwargs = _slot_args(argspec, function), _slot_kwargs(argspec)
+    slot_args, slot_kwargs = _slot_args(function), _slot_kwargs(function)
     pyqtSlot(*slot_args, **slot_kwargs)(function)
     return function
 
 
 def flatten(list_of_lists: List[List[Any]]) -> List[Any]:
     """Flatten a list of lists into a single list with all elements."""
-    return [elem for sublist in list_of_lists for elem in sublist]
+    return list(itertools.chain.from_iterable(list_of_lists))
 
 
 def remove_prefix(text: str, prefix: str) -> str:
@@ -179,6 +188,18 @@ def remove_prefix(text: str, prefix: str) -> str:
     return text
 
 
+def split_count(text: str) -> Tuple[str, str]:
+    """Split leading digits, used as count for commands, from text.
+
+    split_count("12next") = ("12", "next")
+
+    Returns:
+        The digits at the start of text and the remaining text.
+    """
+    match = _count_expression.match(text)
+    return match.group(1), match.group(2)  # type: ignore
+
+
 class AbstractQObjectMeta(wrappertype, ABCMeta):
     """Metaclass to allow setting to be an ABC as well as a QObject."""
 
@@ -186,11 +207,12 @@ class AbstractQObjectMeta(wrappertype, ABCMeta):
 def timed(function):
     """Decorator to time a function and log evaluation time."""
 
+    @functools.wraps(function)
     def inner(*args, **kwargs):
         """Wrap decorated function and add timing."""
-        start = datetime.now()
+        start = time.perf_counter()
         return_value = function(*args, **kwargs)
-        elapsed_in_ms = (datetime.now() - start).total_seconds() * 1000
+        elapsed_in_ms = (time.perf_counter() - start) * 1000
         logging.info("%s: took %.3f ms", function.__qualname__, elapsed_in_ms)
         return return_value
 
@@ -213,6 +235,10 @@ def profile(amount: int = 15):
     Args:
         amount: Number of lines to restrict the output to.
     """
+    # Imported here as these are only needed during development
+    import cProfile
+    from pstats import Stats
+
     cprofile = cProfile.Profile()
     cprofile.enable()
     yield
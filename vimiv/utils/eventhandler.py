@@ -126,7 +126,6 @@ class KeyHandler:
             return
         stored_keys = self.partial_handler.keys.get_text()
         keyname = stored_keys + keyname
-        partial_matches = bindings.partial_matches(keyname)
         # Count
         if keyname and keyname in string.digits and mode != api.modes.COMMAND:
             logging.debug("KeyPressEvent: adding digits")
@@ -138,16 +137,19 @@ class KeyHandler:
             cmd = bindings[keyname]
             runners.run(cmd, count=count, mode=mode)
             self.partial_handler.clear_keys()
-        # Partial match => store keys
-        elif partial_matches:
-            self.partial_handler.keys.add_text(keyname)
-            self.partial_handler.partial_matches.emit(keyname, partial_matches)
-        # Nothing => run default Qt bindings of parent object
         else:
-            # super() is the parent Qt widget
-            super().keyPressEvent(event)  # pylint: disable=no-member
-            api.status.update()  # Will not be called by command
-            self.partial_handler.clear_keys()
+            # Only search for partial matches, which checks all bindings, when needed
+            partial_matches = bindings.partial_matches(keyname)
+            # Partial match => store keys
+            if partial_matches:
+                self.partial_handler.keys.add_text(keyname)
+                self.partial_handler.partial_matches.emit(keyname, partial_matches)
+            # Nothing => run default Qt bindings of parent object
+            else:
+                # super() is the parent Qt widget
+                super().keyPressEvent(event)  # pylint: disable=no-member
+                api.status.update()  # Will not be called by command
+                self.partial_handler.clear_keys()
 
     @staticmethod
     @api.status.module("{keys}")
@@ -15,8 +15,9 @@ widget to update.
 import hashlib
 import os
 import tempfile
+import threading
 from contextlib import suppress
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from PyQt5.QtCore import (
     QRunnable,
@@ -43,8 +44,9 @@ KEY_SOFTWARE = "Software"
 class ThumbnailManager(QObject):
     """Manager to create thumbnails for the thumbnail widgets asynchronously.
 
-    Starts the ThumbnailsAsyncCreator class for a list of paths in an extra
-    thread.
+    Starts ThumbnailsAsyncCreator workers in extra threads which create the
+    thumbnails of all pending paths. The order in which thumbnails are created can
+    be changed using prioritize.
 
     Attributes:
         directory: Directory to store generated thumbnails in.
@@ -52,6 +54,9 @@ class ThumbnailManager(QObject):
         fail_pixmap: QPixmap to display when thumbnail generation failed.
 
         _large: Create large thumbnails.
+        _pending: Dictionary of index to path of thumbnails that are not created yet.
+        _workers: Number of ThumbnailsAsyncCreator workers started and not finished.
+        _lock: Lock to access _pending and _workers from multiple threads.
 
     Signals:
         created: Emitted with index and pixmap when a thumbnail was created.
@@ -63,6 +68,9 @@ class ThumbnailManager(QObject):
     def __init__(self, large: bool = True):
         super().__init__()
         self.large = large
+        self._pending: Dict[int, str] = {}
+        self._workers = 0
+        self._lock = threading.Lock()
         # Thumbnail creation should take no longer than 1 s
         self.pool.setExpiryTimeout(1000)
 
@@ -83,17 +91,62 @@ class ThumbnailManager(QObject):
         QCoreApplication.instance().aboutToQuit.connect(self._on_quit)  # type: ignore
 
     def create_thumbnails_async(self, paths: List[str]) -> None:
-        """Start ThumbnailsAsyncCreator to create thumbnails.
+        """Start ThumbnailsAsyncCreator workers to create thumbnails.
 
         Args:
             paths: Paths to create thumbnails for.
         """
-        self.pool.clear()
-        async_creator = ThumbnailsAsyncCreator(paths, self)
-        self.pool.start(async_creator)
+        with self._lock:
+            self._pending = dict(enumerate(paths))
+        self._start_workers()
+
+    def prioritize(self, thumbnails: Dict[int, str]) -> None:
+        """Create thumbnails before all other pending thumbnails.
+
+        Thumbnails which are not pending any more, e.g. as they were dropped from
+        memory by the thumbnail widget, are created again.
+
+        Args:
+            thumbnails: Dictionary of index to path of the thumbnails to create first.
+        """
+        with self._lock:
+            prioritized = dict(thumbnails)
+            prioritized.update(self._pending)
+            self._pending = prioritized
+        self._start_workers()
+
+    def _start_workers(self) -> None:
+        """Start ThumbnailsAsyncCreator workers for all idle threads of the pool.
+
+        Workers which are still running take the new pending thumbnails as well.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            missing = max(self.pool.maxThreadCount() - self._workers, 0)
+            self._workers += missing
+        for _ in range(missing):
+            self.pool.start(ThumbnailsAsyncCreator(self))
+
+    def take_pending(self) -> Optional[Tuple[int, str]]:
+        """Remove and return index and path of the next thumbnail to create.
+
+        The calling worker is considered finished once nothing is pending.
+
+        Returns:
+            Tuple of index and path, None if no thumbnails are pending.
+        """
+        with self._lock:
+            if not self._pending:
+                self._workers -= 1
+                return None
+            index = next(iter(self._pending))
+            return index, self._pending.pop(index)
 
     @slot
     def _on_quit(self):
+        with self._lock:
+            self._pending = {}
         self.pool.clear()
         self.pool.waitForDone(1000)
 
@@ -101,24 +154,24 @@ class ThumbnailManager(QObject):
 class ThumbnailsAsyncCreator(QRunnable):
     """Create thumbnails asynchronously.
 
-    Adds one ThumbnailCreator runnable to the thread pool for each thumbnail
-    and starts it.
+    Runs a ThumbnailCreator for the next pending thumbnail of the manager until no
+    thumbnails are pending.
 
     Attributes:
-        _paths: List of paths to original images.
         _manager: The ThumbnailManager object used for callback.
     """
 
-    def __init__(self, paths: List[str], manager: ThumbnailManager):
+    def __init__(self, manager: ThumbnailManager):
         super().__init__()
-        self._paths = paths
         self._manager = manager
 
     def run(self) -> None:
-        """Start ThumbnailCreator for each path."""
-        for i, path in enumerate(self._paths):
-            creator = ThumbnailCreator(i, path, self._manager)
-            self._manager.pool.start(creator)
+        """Run ThumbnailCreator for each pending path."""
+        pending = self._manager.take_pending()
+        while pending is not None:
+            index, path = pending
+            ThumbnailCreator(index, path, self._manager).run()
+            pending = self._manager.take_pending()
 
 
 class ThumbnailCreator(QRunnable):